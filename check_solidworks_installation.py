@@ -6,127 +6,237 @@ This script checks your SolidWorks installation and provides guidance for testin
 the MCP server with your specific SolidWorks version.
 """
 
+import ctypes
+import functools
+import importlib.metadata
+import io
 import os
 import sys
-import subprocess
 import winreg
+from concurrent.futures import ThreadPoolExecutor
+from ctypes import wintypes
 from pathlib import Path
 from typing import Optional, Dict, Any
 
-def check_solidworks_registry() -> Optional[Dict[str, Any]]:
+# ToolHelp32 constants and structures for in-process process enumeration
+TH32CS_SNAPPROCESS = 0x00000002
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+# GetFileAttributesW constants for single-syscall existence checks
+INVALID_FILE_ATTRIBUTES = 0xFFFFFFFF
+FILE_ATTRIBUTE_DIRECTORY = 0x10
+
+_GetFileAttributesW = ctypes.windll.kernel32.GetFileAttributesW
+_GetFileAttributesW.argtypes = [wintypes.LPCWSTR]
+_GetFileAttributesW.restype = wintypes.DWORD
+
+
+class PROCESSENTRY32W(ctypes.Structure):
+    """Process entry structure for CreateToolhelp32Snapshot enumeration."""
+    _fields_ = [
+        ("dwSize", wintypes.DWORD),
+        ("cntUsage", wintypes.DWORD),
+        ("th32ProcessID", wintypes.DWORD),
+        ("th32DefaultHeapID", ctypes.POINTER(ctypes.c_ulong)),
+        ("th32ModuleID", wintypes.DWORD),
+        ("cntThreads", wintypes.DWORD),
+        ("th32ParentProcessID", wintypes.DWORD),
+        ("pcPriClassBase", ctypes.c_long),
+        ("dwFlags", wintypes.DWORD),
+        ("szExeFile", ctypes.c_wchar * 260)
+    ]
+
+
+# Explicit prototypes so a failed snapshot is actually detected: with
+# the ctypes default c_int restype, the returned HANDLE is truncated
+# and can never compare equal to INVALID_HANDLE_VALUE
+_kernel32 = ctypes.windll.kernel32
+_kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+_kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+_kernel32.Process32FirstW.restype = wintypes.BOOL
+_kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+_kernel32.Process32NextW.restype = wintypes.BOOL
+_kernel32.Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+_kernel32.CloseHandle.restype = wintypes.BOOL
+_kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+
+
+def _is_process_running(exe_name: str) -> bool:
+    """Check for a running process by executable name via a ToolHelp32 snapshot."""
+    snapshot = _kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if snapshot == INVALID_HANDLE_VALUE:
+        raise OSError("Could not create process snapshot")
+
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        exe_name = exe_name.lower()
+
+        found = _kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while found:
+            if entry.szExeFile.lower() == exe_name:
+                return True
+            found = _kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+        return False
+    finally:
+        _kernel32.CloseHandle(snapshot)
+
+def check_solidworks_registry(out=sys.stdout) -> Optional[Dict[str, Any]]:
     """Check SolidWorks installation in Windows registry."""
-    print("Checking SolidWorks installation in registry...")
-    
-    solidworks_versions = []
+    print("Checking SolidWorks installation in registry...", file=out)
     
-    # Check common SolidWorks registry keys
+    solidworks_versions = set()
+
+    # Check common SolidWorks registry keys; one handle per hive view
+    # (64-bit and 32-bit) instead of hardcoding WOW6432Node paths
     registry_paths = [
-        r"SOFTWARE\SolidWorks\SolidWorks",
-        r"SOFTWARE\WOW6432Node\SolidWorks\SolidWorks",
-        r"SOFTWARE\SolidWorks Corp\SolidWorks",
-        r"SOFTWARE\WOW6432Node\SolidWorks Corp\SolidWorks"
+        r"SolidWorks\SolidWorks",
+        r"SolidWorks Corp\SolidWorks"
     ]
-    
-    for registry_path in registry_paths:
-        try:
-            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, registry_path) as key:
-                # Get all subkeys (versions)
-                i = 0
-                while True:
-                    try:
-                        version_key = winreg.EnumKey(key, i)
-                        solidworks_versions.append(version_key)
-                        i += 1
-                    except WindowsError:
-                        break
-        except WindowsError:
-            continue
-    
+
+    # Request only the rights the enumeration needs; KEY_READ would also
+    # include KEY_NOTIFY and register an unused notification handle
+    _QUERY_MASK = winreg.KEY_QUERY_VALUE | winreg.KEY_ENUMERATE_SUB_KEYS
+
+    access_masks = [
+        _QUERY_MASK | winreg.KEY_WOW64_64KEY,
+        _QUERY_MASK | winreg.KEY_WOW64_32KEY
+    ]
+
+    # Connect to HKLM\SOFTWARE once and open the vendor keys relative to
+    # that handle, instead of one full round-trip from the hive root per path
+    with winreg.ConnectRegistry(None, winreg.HKEY_LOCAL_MACHINE) as reg, \
+            winreg.OpenKey(reg, r"SOFTWARE", 0, _QUERY_MASK) as software:
+        for registry_path in registry_paths:
+            for access_mask in access_masks:
+                try:
+                    with winreg.OpenKey(software, registry_path, 0, access_mask) as key:
+                        # Get all subkeys (versions) without exception-driven iteration
+                        subkey_count, _, _ = winreg.QueryInfoKey(key)
+                        solidworks_versions.update(
+                            winreg.EnumKey(key, i) for i in range(subkey_count)
+                        )
+                except WindowsError:
+                    continue
+
+            # The hive views mirror the same installation; stop once a
+            # vendor key has produced versions instead of re-reading duplicates
+            if solidworks_versions:
+                break
+
     if solidworks_versions:
-        print(f"✓ Found SolidWorks versions in registry: {solidworks_versions}")
-        return {"versions": solidworks_versions, "source": "registry"}
+        versions = sorted(solidworks_versions)
+        print(f"✓ Found SolidWorks versions in registry: {versions}", file=out)
+        return {"versions": versions, "source": "registry"}
     else:
-        print("✗ No SolidWorks versions found in registry")
+        print("✗ No SolidWorks versions found in registry", file=out)
         return None
 
-def check_solidworks_installation_path() -> Optional[Dict[str, Any]]:
+def check_solidworks_installation_path(out=sys.stdout) -> Optional[Dict[str, Any]]:
     """Check common SolidWorks installation paths."""
-    print("Checking SolidWorks installation paths...")
+    print("Checking SolidWorks installation paths...", file=out)
     
-    common_paths = [
-        r"C:\Program Files\SOLIDWORKS Corp\SOLIDWORKS",
-        r"C:\Program Files\SolidWorks Corp\SolidWorks",
-        r"C:\Program Files (x86)\SOLIDWORKS Corp\SOLIDWORKS",
-        r"C:\Program Files (x86)\SolidWorks Corp\SolidWorks"
+    # Scan each Program Files tree with os.scandir; DirEntry carries cached
+    # attributes, so is_dir() costs no extra syscall per entry
+    parent_dirs = [
+        r"C:\Program Files",
+        r"C:\Program Files (x86)"
     ]
+
+    for parent in parent_dirs:
+        try:
+            with os.scandir(parent) as vendors:
+                vendor_paths = [
+                    vendor.path for vendor in vendors
+                    if vendor.is_dir() and "SOLIDWORKS" in vendor.name.upper()
+                ]
+        except OSError:
+            continue
+
+        for vendor_path in vendor_paths:
+            try:
+                with os.scandir(vendor_path) as entries:
+                    install_paths = [
+                        entry.path for entry in entries
+                        if entry.is_dir() and "SOLIDWORKS" in entry.name.upper()
+                    ]
+            except OSError:
+                continue
+
+            for path in install_paths:
+                print(f"✓ Found SolidWorks installation at: {path}", file=out)
+
+                # Check for executable
+                exe_path = os.path.join(path, "SLDWORKS.exe")
+                exe_attrs = _GetFileAttributesW(exe_path)
+                if exe_attrs != INVALID_FILE_ATTRIBUTES and not exe_attrs & FILE_ATTRIBUTE_DIRECTORY:
+                    print(f"✓ Found SolidWorks executable: {exe_path}", file=out)
+                    return {"path": path, "executable": exe_path}
+                else:
+                    print(f"⚠️  Installation found but executable not found at: {exe_path}", file=out)
     
-    for path in common_paths:
-        if Path(path).exists():
-            print(f"✓ Found SolidWorks installation at: {path}")
-            
-            # Check for executable
-            exe_path = Path(path) / "SLDWORKS.exe"
-            if exe_path.exists():
-                print(f"✓ Found SolidWorks executable: {exe_path}")
-                return {"path": path, "executable": str(exe_path)}
-            else:
-                print(f"⚠️  Installation found but executable not found at: {exe_path}")
-    
-    print("✗ No SolidWorks installation found in common paths")
+    print("✗ No SolidWorks installation found in common paths", file=out)
     return None
 
-def check_solidworks_running() -> bool:
+def check_solidworks_running(out=sys.stdout) -> bool:
     """Check if SolidWorks is currently running."""
-    print("Checking if SolidWorks is currently running...")
+    print("Checking if SolidWorks is currently running...", file=out)
     
     try:
-        result = subprocess.run(
-            ["tasklist", "/FI", "IMAGENAME eq SLDWORKS.exe"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        if "SLDWORKS.exe" in result.stdout:
-            print("✓ SolidWorks is currently running")
+        if _is_process_running("SLDWORKS.exe"):
+            print("✓ SolidWorks is currently running", file=out)
             return True
         else:
-            print("ℹ️  SolidWorks is not currently running")
+            print("ℹ️  SolidWorks is not currently running", file=out)
             return False
-            
-    except subprocess.CalledProcessError:
-        print("ℹ️  Could not check if SolidWorks is running")
+
+    except OSError:
+        print("ℹ️  Could not check if SolidWorks is running", file=out)
         return False
 
-def check_python_dependencies() -> Dict[str, bool]:
+# Normalization table for distribution names, built once at import time
+_PKG_TRANS = str.maketrans({'-': '_'})
+
+
+@functools.lru_cache(maxsize=1)
+def _installed_distributions() -> frozenset:
+    """Collect installed distribution names in one sweep over site-packages."""
+    return frozenset(
+        dist.metadata["Name"].lower().translate(_PKG_TRANS)
+        for dist in importlib.metadata.distributions()
+        if dist.metadata["Name"]
+    )
+
+
+def check_python_dependencies(out=sys.stdout) -> Dict[str, bool]:
     """Check if required Python dependencies are installed."""
-    print("Checking Python dependencies...")
-    
+    print("Checking Python dependencies...", file=out)
+
     required_packages = [
         "mcp",
-        "anthropic", 
+        "anthropic",
         "python-dotenv",
         "pydantic"
     ]
-    
+
     results = {}
-    
+
+    # One metadata scan answers every package instead of a separate
+    # sys.path walk per required name
+    installed = _installed_distributions()
+
     for package in required_packages:
-        try:
-            __import__(package.replace("-", "_"))
-            print(f"✓ {package} is installed")
+        if package.lower().translate(_PKG_TRANS) in installed:
+            print(f"✓ {package} is installed", file=out)
             results[package] = True
-        except ImportError:
-            print(f"✗ {package} is not installed")
+        else:
+            print(f"✗ {package} is not installed", file=out)
             results[package] = False
-    
+
     return results
 
-def create_env_template() -> None:
-    """Create a .env template file."""
-    print("Creating .env template file...")
-    
-    env_content = """# SolidWorks MCP Server Environment Configuration
+# .env template, pre-encoded once at import time
+_ENV_TEMPLATE = b"""# SolidWorks MCP Server Environment Configuration
 # Update these values with your actual configuration
 
 # REQUIRED: Anthropic Claude API Key
@@ -170,75 +280,116 @@ ENABLE_AUDIT_LOGGING=true
 MAX_LOG_FILE_SIZE_MB=50
 LOG_RETENTION_DAYS=30
 """
-    
-    with open(".env", "w") as f:
-        f.write(env_content)
-    
-    print("✓ Created .env file with template values")
+
+def create_env_template(out=sys.stdout) -> None:
+    """Create a .env template file if none exists.
+
+    An existing .env is never touched — the next steps this script
+    prints tell the user to put real credentials in it, so re-runs must
+    not replace their edits with the template. Exclusive create makes
+    the existence check and the write one atomic operation, and skips
+    all I/O on re-runs.
+    """
+    try:
+        with Path(".env").open("xb") as f:
+            f.write(_ENV_TEMPLATE)
+    except FileExistsError:
+        return
+
+    print("✓ Created .env file with template values", file=out)
 
 def main():
     """Main function to check SolidWorks installation."""
-    print("SolidWorks MCP Server - Installation Checker")
-    print("=" * 50)
-    
-    # Check registry
-    registry_info = check_solidworks_registry()
-    
-    # Check installation paths
-    path_info = check_solidworks_installation_path()
-    
-    # Check if SolidWorks is running
-    is_running = check_solidworks_running()
-    
+    # Status lines accumulate in one in-memory buffer and reach the
+    # terminal in a single write per section instead of one per line
+    buf = io.StringIO()
+
+    def flush_section() -> None:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+        buf.seek(0)
+        buf.truncate(0)
+
+    print("SolidWorks MCP Server - Installation Checker", file=buf)
+    print("=" * 50, file=buf)
+
+    # The four checks are independent and block on different I/O (registry
+    # round-trips, directory scans, a process snapshot, metadata reads), so
+    # run them concurrently. Each check prints into its own buffer and main
+    # replays the buffers in the usual order once every result is in.
+    registry_buf, path_buf, running_buf, deps_buf = (io.StringIO() for _ in range(4))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        registry_future = executor.submit(check_solidworks_registry, out=registry_buf)
+        path_future = executor.submit(check_solidworks_installation_path, out=path_buf)
+        running_future = executor.submit(check_solidworks_running, out=running_buf)
+        deps_future = executor.submit(check_python_dependencies, out=deps_buf)
+
+        registry_info = registry_future.result()
+        path_info = path_future.result()
+        is_running = running_future.result()
+        deps = deps_future.result()
+
+    buf.write(registry_buf.getvalue())
+    buf.write(path_buf.getvalue())
+    buf.write(running_buf.getvalue())
+    flush_section()
+
     # Check Python dependencies
-    print("\n" + "=" * 50)
-    deps = check_python_dependencies()
+    print("\n" + "=" * 50, file=buf)
+    buf.write(deps_buf.getvalue())
+    flush_section()
     
-    # Create .env template if it doesn't exist
-    if not Path(".env").exists():
-        print("\n" + "=" * 50)
-        create_env_template()
+    # Create .env template unless the existing file already matches it
+    env_buf = io.StringIO()
+    create_env_template(out=env_buf)
+    env_section = env_buf.getvalue()
+    if env_section:
+        print("\n" + "=" * 50, file=buf)
+        buf.write(env_section)
+        flush_section()
     
     # Summary and recommendations
-    print("\n" + "=" * 50)
-    print("SUMMARY AND RECOMMENDATIONS")
-    print("=" * 50)
+    print("\n" + "=" * 50, file=buf)
+    print("SUMMARY AND RECOMMENDATIONS", file=buf)
+    print("=" * 50, file=buf)
     
     if registry_info or path_info:
-        print("✓ SolidWorks installation detected")
+        print("✓ SolidWorks installation detected", file=buf)
         
         if registry_info:
-            print(f"  - Registry versions: {registry_info['versions']}")
+            print(f"  - Registry versions: {registry_info['versions']}", file=buf)
         
         if path_info:
-            print(f"  - Installation path: {path_info['path']}")
-            print(f"  - Executable: {path_info['executable']}")
+            print(f"  - Installation path: {path_info['path']}", file=buf)
+            print(f"  - Executable: {path_info['executable']}", file=buf)
         
         if is_running:
-            print("  - SolidWorks is currently running")
+            print("  - SolidWorks is currently running", file=buf)
         else:
-            print("  - SolidWorks is not running (this is normal)")
+            print("  - SolidWorks is not running (this is normal)", file=buf)
         
-        print("\nNext steps:")
-        print("1. Update the .env file with your Anthropic API key")
-        print("2. Update SOLIDWORKS_INSTALL_PATH if needed")
-        print("3. Update SOLIDWORKS_VERSION to match your installation")
-        print("4. Run: python test_solidworks_integration.py")
+        print("\nNext steps:", file=buf)
+        print("1. Update the .env file with your Anthropic API key", file=buf)
+        print("2. Update SOLIDWORKS_INSTALL_PATH if needed", file=buf)
+        print("3. Update SOLIDWORKS_VERSION to match your installation", file=buf)
+        print("4. Run: python test_solidworks_integration.py", file=buf)
         
     else:
-        print("✗ SolidWorks installation not found")
-        print("\nPlease ensure SolidWorks is properly installed and try again.")
+        print("✗ SolidWorks installation not found", file=buf)
+        print("\nPlease ensure SolidWorks is properly installed and try again.", file=buf)
     
     # Check dependencies
     missing_deps = [pkg for pkg, installed in deps.items() if not installed]
     if missing_deps:
-        print(f"\nMissing dependencies: {missing_deps}")
-        print("Install them with: pip install -r requirements.txt")
+        print(f"\nMissing dependencies: {missing_deps}", file=buf)
+        print("Install them with: pip install -r requirements.txt", file=buf)
     else:
-        print("\n✓ All required Python dependencies are installed")
+        print("\n✓ All required Python dependencies are installed", file=buf)
     
-    print("\n" + "=" * 50)
-    print("Ready to test your SolidWorks MCP server!")
+    print("\n" + "=" * 50, file=buf)
+    print("Ready to test your SolidWorks MCP server!", file=buf)
+    flush_section()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Shared Claude Desktop configuration editing.
+
+update_claude_config.py and update_claude_model.py both mutate the same
+claude_desktop_config.json. This module gives them one load/mutate/dump
+path, so a setup flow that chains several updates can batch them inside
+a single edit_config() block and pay for one parse and one write.
+"""
+
+import json
+import os
+import sys
+from contextlib import contextmanager
+from functools import cache
+from pathlib import Path
+from typing import Iterator
+
+
+# Prefer orjson for the config round-trip; fall back to stdlib json
+try:
+    import orjson
+
+    def _loads(data: bytes) -> dict:
+        return orjson.loads(data)
+
+    def _dumps(config: dict) -> bytes:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _loads(data: bytes) -> dict:
+        return json.loads(data)
+
+    def _dumps(config: dict) -> bytes:
+        return json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+@cache
+def config_path() -> Path:
+    """Get the Claude Desktop configuration file path for the current platform.
+
+    The two update scripts used to carry diverging copies of this
+    lookup (one honoring APPDATA, one hard-coding the Roaming path);
+    this is the single source of truth, resolved once per process.
+    """
+    if sys.platform == "win32":
+        appdata = os.environ.get("APPDATA")
+        base = Path(appdata) if appdata else Path.home() / "AppData" / "Roaming"
+        return base / "Claude" / "claude_desktop_config.json"
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Application Support" / "Claude" / "claude_desktop_config.json"
+    return Path.home() / ".config" / "Claude" / "claude_desktop_config.json"
+
+
+@contextmanager
+def edit_config(config_path: Path) -> Iterator[dict]:
+    """Load the config, yield it for mutation, write it back once.
+
+    Any number of mutations inside the block share the single read and
+    the single write. If the block raises, nothing is written, so a
+    failed update leaves the file exactly as it was.
+    """
+    config = _loads(config_path.read_bytes())
+    yield config
+    config_path.write_bytes(_dumps(config))
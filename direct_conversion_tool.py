@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Direct SolidWorks File Conversion Tool
+
+This script converts a SolidWorks file from the command line without going
+through an MCP client. It validates the environment, initializes the
+SolidWorks tools, and runs a single conversion.
+
+Usage:
+    python direct_conversion_tool.py input.sldprt [output.step] [--format STEP]
+"""
+
+import argparse
+import asyncio
+import atexit
+import functools
+import logging
+import logging.handlers
+import os
+import sys
+from typing import Optional
+
+# Add src directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+# Configure logging; debug-log records are batched in memory and flushed
+# to disk in blocks instead of one write syscall per record
+_file_handler = logging.FileHandler("conversion_debug.log", delay=True)
+_memory_handler = logging.handlers.MemoryHandler(
+    capacity=1024,
+    flushLevel=logging.ERROR,
+    target=_file_handler
+)
+atexit.register(_memory_handler.flush)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    handlers=[
+        logging.StreamHandler(sys.stdout),
+        _memory_handler
+    ]
+)
+logger = logging.getLogger("direct-conversion-tool")
+
+# SolidWorks input extensions, as a module-level singleton for O(1) membership
+_SUPPORTED_FORMATS = frozenset({'.SLDPRT', '.SLDASM', '.SLDDRW'})
+
+
+def _environment_fingerprint() -> int:
+    """Hash the configuration-relevant environment variables."""
+    return hash(tuple(sorted(
+        (key, value) for key, value in os.environ.items()
+        if key.startswith(('SOLIDWORKS_', 'CLAUDE_', 'ANTHROPIC_'))
+    )))
+
+
+@functools.lru_cache(maxsize=1)
+def _validate_environment(env_fingerprint: int) -> None:
+    """Run environment validation once per environment fingerprint."""
+    # Imported here so argument errors exit before pulling in the config stack
+    from config import ConfigValidator
+
+    ConfigValidator().validate_environment()
+
+
+class DirectConversionTool:
+    """Standalone SolidWorks file conversion without an MCP client."""
+
+    def __init__(self):
+        """Initialize the conversion tool."""
+        self.solidworks_tools = None
+
+    def load_configuration(self) -> bool:
+        """Validate the environment configuration."""
+        logger.info("Validating environment configuration...")
+
+        try:
+            # Cached per environment fingerprint, so batch scripts importing
+            # this module skip re-validation on repeat runs
+            _validate_environment(_environment_fingerprint())
+            logger.info("✓ Environment configuration validated")
+            return True
+
+        except Exception as e:
+            logger.error(f"✗ Configuration validation failed: {e}")
+            return False
+
+    def initialize_solidworks_tools(self) -> bool:
+        """Initialize the SolidWorks tools."""
+        logger.info("Initializing SolidWorks tools...")
+
+        try:
+            # Imported here so the SolidWorks/COM stack is only loaded when needed
+            from tools.solidworks_tools import SolidWorksTools
+
+            self.solidworks_tools = SolidWorksTools()
+            logger.info("✓ SolidWorks tools initialized")
+            return True
+
+        except Exception as e:
+            logger.error(f"✗ SolidWorks tools initialization failed: {e}")
+            return False
+
+    def validate_input_file(self, input_file_path: str) -> bool:
+        """Validate that the input file exists and is a SolidWorks file."""
+        # One stat call answers both existence and size
+        try:
+            st = os.stat(input_file_path)
+        except FileNotFoundError:
+            logger.error(f"✗ Input file not found: {input_file_path}")
+            return False
+
+        logger.debug(f"Input file size: {st.st_size} bytes")
+
+        file_ext = os.path.splitext(input_file_path)[1].upper()
+        if file_ext not in _SUPPORTED_FORMATS:
+            logger.error(f"✗ Unsupported input format: {file_ext}")
+            return False
+
+        logger.info(f"✓ Input file validated: {input_file_path}")
+        return True
+
+    def prepare_output_path(self, input_file_path: str, output_file_path: Optional[str], export_format: str) -> str:
+        """Derive the output path from the input path when not given."""
+        if output_file_path:
+            return output_file_path
+
+        dirname, filename = os.path.split(input_file_path)
+        stem = os.path.splitext(filename)[0]
+        return os.path.join(dirname, f"{stem}.{export_format.lower()}")
+
+    async def convert_file_directly(self, input_file_path: str, output_file_path: str, export_format: str) -> bool:
+        """Run a single file conversion."""
+        logger.info(f"Converting {input_file_path} -> {output_file_path} ({export_format})")
+
+        try:
+            result = await self.solidworks_tools.convert_file(
+                input_file_path=input_file_path,
+                output_file_path=output_file_path,
+                export_format=export_format
+            )
+
+            if result.get("status") != "success":
+                logger.error(f"✗ Conversion failed: {result.get('message', 'unknown error')}")
+                return False
+
+            try:
+                output_size = os.stat(output_file_path).st_size
+                logger.info(f"✓ Conversion complete: {output_file_path} ({output_size} bytes)")
+            except FileNotFoundError:
+                logger.info(f"✓ Conversion reported success: {output_file_path}")
+
+            return True
+
+        except Exception as e:
+            logger.error(f"✗ Conversion failed: {e}")
+            return False
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Direct SolidWorks file conversion")
+    parser.add_argument("input_file", help="Path to the SolidWorks file to convert")
+    parser.add_argument("output_file", nargs="?", default=None, help="Path for the converted output file")
+    parser.add_argument("--format", default="STEP", help="Export format (STEP, IGES, STL, PDF, etc.)")
+    return parser.parse_args()
+
+
+async def main() -> int:
+    """Main function for direct conversion."""
+    args = parse_arguments()
+
+    tool = DirectConversionTool()
+
+    if not tool.load_configuration():
+        return 1
+
+    if not tool.validate_input_file(args.input_file):
+        return 1
+
+    if not tool.initialize_solidworks_tools():
+        return 1
+
+    output_file = tool.prepare_output_path(args.input_file, args.output_file, args.format)
+
+    if not await tool.convert_file_directly(args.input_file, output_file, args.format):
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
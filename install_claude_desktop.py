@@ -5,13 +5,32 @@ Claude Desktop MCP Server Installer
 This script helps install the SolidWorks MCP Server configuration in Claude Desktop.
 """
 
+import hashlib
 import os
 import sys
 import json
 import shutil
+from functools import cache
 from pathlib import Path
 from typing import Optional
 
+# Prefer orjson for the config round-trip; fall back to stdlib json
+try:
+    import orjson
+
+    def _loads(data: bytes) -> dict:
+        return orjson.loads(data)
+
+    def _dumps(config: dict) -> bytes:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _loads(data: bytes) -> dict:
+        return json.loads(data)
+
+    def _dumps(config: dict) -> bytes:
+        return json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
+
+@cache
 def get_claude_desktop_config_path() -> Optional[Path]:
     """Get the Claude Desktop configuration file path for the current platform."""
     if sys.platform == "win32":
@@ -40,7 +59,14 @@ def backup_existing_config(config_path: Path) -> bool:
     if config_path.exists():
         backup_path = config_path.with_suffix('.json.backup')
         try:
-            shutil.copy2(config_path, backup_path)
+            config_hash = hashlib.blake2b(config_path.read_bytes(), digest_size=16).digest()
+            if backup_path.exists():
+                backup_hash = hashlib.blake2b(backup_path.read_bytes(), digest_size=16).digest()
+                if backup_hash == config_hash:
+                    print(f"✓ Existing backup is already up to date: {backup_path}")
+                    return True
+
+            shutil.copyfile(config_path, backup_path)
             print(f"✓ Backed up existing config to: {backup_path}")
             return True
         except Exception as e:
@@ -52,14 +78,13 @@ def load_current_config(config_path: Path) -> dict:
     """Load existing Claude Desktop configuration or create new one."""
     if config_path.exists():
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                if content:
-                    config = json.loads(content)
-                    print("✓ Loaded existing Claude Desktop configuration")
-                    return config
-                else:
-                    print("✓ Existing config is empty, creating new one")
+            content = config_path.read_bytes().strip()
+            if content:
+                config = _loads(content)
+                print("✓ Loaded existing Claude Desktop configuration")
+                return config
+            else:
+                print("✓ Existing config is empty, creating new one")
         except Exception as e:
             print(f"Warning: Could not load existing config: {e}")
     
@@ -68,6 +93,7 @@ def load_current_config(config_path: Path) -> dict:
     print("✓ Created new Claude Desktop configuration")
     return config
 
+@cache
 def get_project_paths() -> tuple[str, str]:
     """Get the current project paths."""
     current_dir = Path.cwd()
@@ -113,10 +139,14 @@ def create_solidworks_config(python_path: str, main_py_path: str) -> dict:
     }
 
 def save_config(config: dict, config_path: Path) -> bool:
-    """Save the configuration to Claude Desktop config file."""
+    """Save the configuration to Claude Desktop config file atomically."""
     try:
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        # Serialize fully, write the temp file in one shot, then swap it in
+        # so a crash mid-write can never corrupt the existing config
+        data = _dumps(config)
+        tmp_path = config_path.with_suffix('.json.tmp')
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, config_path)
         print(f"✓ Saved configuration to: {config_path}")
         return True
     except Exception as e:
@@ -125,32 +155,36 @@ def save_config(config: dict, config_path: Path) -> bool:
 
 def print_instructions(config_path: Path):
     """Print installation instructions."""
-    print("\n" + "=" * 60)
-    print("CLAUDE DESKTOP MCP SERVER INSTALLATION")
-    print("=" * 60)
-    
-    print(f"\n✅ Configuration installed at: {config_path}")
-    
-    print("\n📋 Next Steps:")
-    print("1. Update your Anthropic API key in the configuration file")
-    print("2. Restart Claude Desktop")
-    print("3. Check that the SolidWorks MCP server appears in your tools")
-    
-    print("\n🔧 To update your API key:")
-    print(f"   Edit: {config_path}")
-    print("   Replace 'your-anthropic-api-key-here' with your actual API key")
-    
-    print("\n🚀 Test the installation:")
-    print("   - Open Claude Desktop")
-    print("   - Try asking: 'What SolidWorks tools are available?'")
-    print("   - Or: 'Validate my SolidWorks installation'")
-    
-    print("\n📁 Configuration details:")
-    print(f"   - Config file: {config_path}")
-    print(f"   - Python path: {sys.executable}")
-    print(f"   - MCP server: {Path.cwd() / 'src' / 'main.py'}")
-    
-    print("\n" + "=" * 60)
+    # Emit the whole block in one stdout write rather than one per line
+    print("\n".join([
+        "",
+        "=" * 60,
+        "CLAUDE DESKTOP MCP SERVER INSTALLATION",
+        "=" * 60,
+        "",
+        f"✅ Configuration installed at: {config_path}",
+        "",
+        "📋 Next Steps:",
+        "1. Update your Anthropic API key in the configuration file",
+        "2. Restart Claude Desktop",
+        "3. Check that the SolidWorks MCP server appears in your tools",
+        "",
+        "🔧 To update your API key:",
+        f"   Edit: {config_path}",
+        "   Replace 'your-anthropic-api-key-here' with your actual API key",
+        "",
+        "🚀 Test the installation:",
+        "   - Open Claude Desktop",
+        "   - Try asking: 'What SolidWorks tools are available?'",
+        "   - Or: 'Validate my SolidWorks installation'",
+        "",
+        "📁 Configuration details:",
+        f"   - Config file: {config_path}",
+        f"   - Python path: {sys.executable}",
+        f"   - MCP server: {get_project_paths()[1]}",
+        "",
+        "=" * 60
+    ]))
 
 def main():
     """Main installation function."""
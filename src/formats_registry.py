@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Shared registry of supported file formats for the SolidWorks MCP Server.
+
+Both the tool and resource handlers derive their format listings from the
+constants below, so the data lives in exactly one place and neither side
+can drift from the other.
+"""
+
+from types import MappingProxyType
+from typing import Mapping, Tuple
+
+# TODO: Derive the registry from the SolidWorks API once integrated
+
+
+def _freeze(*entries: dict) -> Tuple[Mapping, ...]:
+    """Freeze format entries into an immutable tuple of read-only mappings."""
+    return tuple(MappingProxyType(entry) for entry in entries)
+
+
+IMPORT: Tuple[Mapping, ...] = _freeze(
+    {"extension": "step", "description": "STEP Files", "version": "AP214/AP203"},
+    {"extension": "iges", "description": "IGES Files", "version": "2014"},
+    {"extension": "stl", "description": "STL Files", "type": "mesh"},
+    {"extension": "obj", "description": "Wavefront OBJ", "type": "mesh"},
+    {"extension": "3mf", "description": "3D Manufacturing Format", "version": "1.0"},
+    {"extension": "ply", "description": "Polygon File Format", "type": "mesh"}
+)
+
+EXPORT: Tuple[Mapping, ...] = _freeze(
+    {"extension": "step", "description": "STEP Files", "version": "AP214/AP203"},
+    {"extension": "iges", "description": "IGES Files", "version": "2014"},
+    {"extension": "stl", "description": "STL Files", "type": "mesh"},
+    {"extension": "pdf", "description": "PDF Documents", "type": "document"},
+    {"extension": "dwg", "description": "AutoCAD Drawing", "version": "2024"},
+    {"extension": "dxf", "description": "Drawing Exchange Format", "version": "2024"},
+    {"extension": "obj", "description": "Wavefront OBJ", "type": "mesh"},
+    {"extension": "3mf", "description": "3D Manufacturing Format", "version": "1.0"}
+)
+
+NATIVE: Tuple[Mapping, ...] = _freeze(
+    {"extension": "sldprt", "description": "SolidWorks Part", "type": "part"},
+    {"extension": "sldasm", "description": "SolidWorks Assembly", "type": "assembly"},
+    {"extension": "slddrw", "description": "SolidWorks Drawing", "type": "drawing"}
+)
+
+# Uppercase short names, as exposed by the get_supported_formats tool
+IMPORT_FORMAT_NAMES: Tuple[str, ...] = tuple(entry["extension"].upper() for entry in IMPORT)
+EXPORT_FORMAT_NAMES: Tuple[str, ...] = tuple(entry["extension"].upper() for entry in EXPORT)
@@ -25,15 +25,8 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from config import Config
 from server import MCPServer
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("solidworks_mcp.log")
-    ]
-)
+# Logging is configured in configure_logging() once the CLI arguments are
+# known, so the log file is opened exactly once with its final path
 logger = logging.getLogger("solidworks-mcp-server")
 
 
@@ -64,18 +57,16 @@ def configure_logging(log_level: str, log_file: str, debug: bool) -> None:
     level = getattr(logging, log_level.upper())
     if debug:
         level = logging.DEBUG
-    
-    # Update logging configuration
-    logging.getLogger().setLevel(level)
-    
-    # Update file handler
-    for handler in logging.getLogger().handlers:
-        if isinstance(handler, logging.FileHandler):
-            handler.close()
-            logging.getLogger().removeHandler(handler)
-    
-    logging.getLogger().addHandler(logging.FileHandler(log_file))
-    logger.info(f"Logging configured: level={log_level}, file={log_file}, debug={debug}")
+
+    logging.basicConfig(
+        level=level,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[
+            logging.StreamHandler(),
+            logging.FileHandler(log_file)
+        ]
+    )
+    logger.info("Logging configured: level=%s, file=%s, debug=%s", log_level, log_file, debug)
 
 
 async def main() -> None:
@@ -115,7 +106,7 @@ async def main() -> None:
     except KeyboardInterrupt:
         logger.info("Server shutdown requested by user")
     except Exception as e:
-        logger.error(f"Server startup error: {e}")
+        logger.error("Server startup error: %s", e)
         sys.exit(1)
 
 
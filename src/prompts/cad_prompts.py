@@ -6,34 +6,17 @@ This module provides AI prompt templates for CAD operations
 following the Single Responsibility Principle.
 """
 
+import functools
 import logging
 from typing import Dict, List
 
-import mcp.types as types
-
 logger = logging.getLogger(__name__)
 
 
-class SolidWorksPrompts:
-    """
-    AI prompt templates for CAD operations following SRP.
-    
-    This class handles all AI prompt generation for SolidWorks operations
-    including analysis, format suggestions, and troubleshooting.
-    """
-    
-    def __init__(self):
-        """Initialize SolidWorks prompts."""
-        self.logger = logging.getLogger(self.__class__.__name__)
-    
-    async def generate_analyze_cad_file_prompt(
-        self, 
-        file_path: str, 
-        analysis_focus: str = None
-    ) -> str:
-        """Generate prompt for CAD file analysis."""
-        try:
-            base_prompt = f"""
+# Static prompt template fragments, built once at import time.
+# The generate_* methods only format and join these pieces per request.
+
+_ANALYZE_BASE = """
 You are an expert CAD engineer analyzing a SolidWorks file. Please provide a comprehensive analysis of the CAD file located at: {file_path}
 
 Please analyze the following aspects:
@@ -68,10 +51,9 @@ Please analyze the following aspects:
    - Parametric design effectiveness
    - Documentation completeness
 """
-            
-            if analysis_focus:
-                focus_prompts = {
-                    "design": """
+
+_FOCUS_PROMPTS = {
+    "design": """
 Focus particularly on:
 - Design methodology and approach
 - Feature modeling techniques
@@ -79,7 +61,7 @@ Focus particularly on:
 - Design intent capture
 - Aesthetic and functional considerations
 """,
-                    "manufacturing": """
+    "manufacturing": """
 Focus particularly on:
 - Manufacturing feasibility
 - Recommended production methods
@@ -88,7 +70,7 @@ Focus particularly on:
 - Cost optimization opportunities
 - Quality control considerations
 """,
-                    "performance": """
+    "performance": """
 Focus particularly on:
 - Structural analysis potential
 - Load-bearing capabilities
@@ -97,38 +79,19 @@ Focus particularly on:
 - Safety factors
 - Performance optimization suggestions
 """
-                }
-                
-                if analysis_focus.lower() in focus_prompts:
-                    base_prompt += focus_prompts[analysis_focus.lower()]
-            
-            base_prompt += """
+}
+
+_ANALYZE_TAIL = """
 
 Please provide your analysis in a structured format with clear headings and actionable insights. Include specific recommendations for improvements where applicable.
 """
-            
-            return base_prompt.strip()
-            
-        except Exception as e:
-            self.logger.error(f"Error generating analyze CAD file prompt: {e}")
-            raise
-    
-    async def generate_suggest_export_format_prompt(
-        self, 
-        use_case: str, 
-        file_type: str = None
-    ) -> str:
-        """Generate prompt for export format suggestion."""
-        try:
-            base_prompt = f"""
+
+_EXPORT_BASE = """
 You are a CAD file format expert. A user needs to export a SolidWorks file for the following use case: {use_case}
 
 """
-            
-            if file_type:
-                base_prompt += f"The source file is a SolidWorks {file_type}.\n\n"
-            
-            base_prompt += """
+
+_EXPORT_TAIL = """
 Please recommend the optimal export format(s) and provide detailed guidance including:
 
 1. **Primary Recommendation**:
@@ -161,35 +124,15 @@ Please recommend the optimal export format(s) and provide detailed guidance incl
 
 Please provide specific, actionable recommendations with clear reasoning for your choices.
 """
-            
-            return base_prompt.strip()
-            
-        except Exception as e:
-            self.logger.error(f"Error generating export format suggestion prompt: {e}")
-            raise
-    
-    async def generate_troubleshoot_conversion_prompt(
-        self, 
-        error_message: str, 
-        source_format: str = None, 
-        target_format: str = None
-    ) -> str:
-        """Generate prompt for conversion troubleshooting."""
-        try:
-            base_prompt = f"""
+
+_TROUBLESHOOT_BASE = """
 You are a SolidWorks conversion troubleshooting expert. A user is experiencing the following error during file conversion:
 
 **Error Message**: {error_message}
 
 """
-            
-            if source_format:
-                base_prompt += f"**Source Format**: {source_format}\n"
-            
-            if target_format:
-                base_prompt += f"**Target Format**: {target_format}\n"
-            
-            base_prompt += """
+
+_TROUBLESHOOT_TAIL = """
 
 Please provide comprehensive troubleshooting guidance including:
 
@@ -229,94 +172,171 @@ Please provide comprehensive troubleshooting guidance including:
 
 Please provide clear, actionable solutions prioritized by likelihood of success and ease of implementation.
 """
-            
-            return base_prompt.strip()
-            
-        except Exception as e:
-            self.logger.error(f"Error generating troubleshooting prompt: {e}")
-            raise
+
+
+# Strip the static template edges once at import so the per-call result
+# needs no O(n) strip pass
+_ANALYZE_BASE = _ANALYZE_BASE.lstrip()
+_ANALYZE_TAIL = _ANALYZE_TAIL.rstrip()
+_EXPORT_BASE = _EXPORT_BASE.lstrip()
+_EXPORT_TAIL = _EXPORT_TAIL.rstrip()
+_TROUBLESHOOT_BASE = _TROUBLESHOOT_BASE.lstrip()
+_TROUBLESHOOT_TAIL = _TROUBLESHOOT_TAIL.rstrip()
+
+
+@functools.lru_cache(maxsize=1)
+def _build_prompt_list() -> List["types.Prompt"]:
+    """Build the static MCP prompt declarations once per process."""
+    # Imported lazily so loading this module does not pull in the MCP stack
+    import mcp.types as types
+
+    return [
+        types.Prompt(
+            name="analyze_cad_file",
+            description="Analyze CAD file properties and provide insights",
+            arguments=[
+                types.PromptArgument(
+                    name="file_path",
+                    description="Path to the CAD file",
+                    required=True
+                ),
+                types.PromptArgument(
+                    name="analysis_focus",
+                    description="Focus area for analysis (design, manufacturing, performance)",
+                    required=False
+                )
+            ]
+        ),
+        types.Prompt(
+            name="suggest_export_format",
+            description="Suggest optimal export format based on use case",
+            arguments=[
+                types.PromptArgument(
+                    name="use_case",
+                    description="Intended use case (3D printing, simulation, sharing, etc.)",
+                    required=True
+                ),
+                types.PromptArgument(
+                    name="file_type",
+                    description="Source file type (part, assembly, drawing)",
+                    required=False
+                )
+            ]
+        ),
+        types.Prompt(
+            name="troubleshoot_conversion",
+            description="Help troubleshoot file conversion issues",
+            arguments=[
+                types.PromptArgument(
+                    name="error_message",
+                    description="Error message encountered during conversion",
+                    required=True
+                ),
+                types.PromptArgument(
+                    name="source_format",
+                    description="Source file format",
+                    required=False
+                ),
+                types.PromptArgument(
+                    name="target_format", 
+                    description="Target export format",
+                    required=False
+                )
+            ]
+        )
+    ]
+
+
+class SolidWorksPrompts:
+    """
+    AI prompt templates for CAD operations following SRP.
+    
+    This class handles all AI prompt generation for SolidWorks operations
+    including analysis, format suggestions, and troubleshooting.
+    """
     
+    def __init__(self):
+        """Initialize SolidWorks prompts."""
+        self.logger = logging.getLogger(self.__class__.__name__)
+    
+    def generate_analyze_cad_file_prompt(
+        self, 
+        file_path: str, 
+        analysis_focus: str = None
+    ) -> str:
+        """Generate prompt for CAD file analysis."""
+        parts = [_ANALYZE_BASE.format(file_path=file_path)]
+
+        if analysis_focus:
+            focus_prompt = _FOCUS_PROMPTS.get(analysis_focus.lower())
+            if focus_prompt:
+                parts.append(focus_prompt)
+
+        parts.append(_ANALYZE_TAIL)
+
+        return "".join(parts)
+
+    def generate_suggest_export_format_prompt(
+        self, 
+        use_case: str, 
+        file_type: str = None
+    ) -> str:
+        """Generate prompt for export format suggestion."""
+        parts = [_EXPORT_BASE.format(use_case=use_case)]
+
+        if file_type:
+            parts.append(f"The source file is a SolidWorks {file_type}.\n\n")
+
+        parts.append(_EXPORT_TAIL)
+
+        return "".join(parts)
+
+    def generate_troubleshoot_conversion_prompt(
+        self, 
+        error_message: str, 
+        source_format: str = None, 
+        target_format: str = None
+    ) -> str:
+        """Generate prompt for conversion troubleshooting."""
+        parts = [_TROUBLESHOOT_BASE.format(error_message=error_message)]
+
+        if source_format:
+            parts.append(f"**Source Format**: {source_format}\n")
+
+        if target_format:
+            parts.append(f"**Target Format**: {target_format}\n")
+
+        parts.append(_TROUBLESHOOT_TAIL)
+
+        return "".join(parts)
+
     # MCP Prompt Handler Methods
     
-    async def list_prompts(self) -> List[types.Prompt]:
+    def list_prompts(self) -> List["types.Prompt"]:
         """List available CAD prompts for MCP."""
         try:
-            return [
-                types.Prompt(
-                    name="analyze_cad_file",
-                    description="Analyze CAD file properties and provide insights",
-                    arguments=[
-                        types.PromptArgument(
-                            name="file_path",
-                            description="Path to the CAD file",
-                            required=True
-                        ),
-                        types.PromptArgument(
-                            name="analysis_focus",
-                            description="Focus area for analysis (design, manufacturing, performance)",
-                            required=False
-                        )
-                    ]
-                ),
-                types.Prompt(
-                    name="suggest_export_format",
-                    description="Suggest optimal export format based on use case",
-                    arguments=[
-                        types.PromptArgument(
-                            name="use_case",
-                            description="Intended use case (3D printing, simulation, sharing, etc.)",
-                            required=True
-                        ),
-                        types.PromptArgument(
-                            name="file_type",
-                            description="Source file type (part, assembly, drawing)",
-                            required=False
-                        )
-                    ]
-                ),
-                types.Prompt(
-                    name="troubleshoot_conversion",
-                    description="Help troubleshoot file conversion issues",
-                    arguments=[
-                        types.PromptArgument(
-                            name="error_message",
-                            description="Error message encountered during conversion",
-                            required=True
-                        ),
-                        types.PromptArgument(
-                            name="source_format",
-                            description="Source file format",
-                            required=False
-                        ),
-                        types.PromptArgument(
-                            name="target_format", 
-                            description="Target export format",
-                            required=False
-                        )
-                    ]
-                )
-            ]
+            return _build_prompt_list()
         except Exception as e:
             self.logger.error(f"Error listing prompts: {e}")
             return []
-    
+
     async def get_prompt(self, name: str, arguments: Dict[str, str]) -> str:
         """Handle MCP prompt requests."""
         try:
             self.logger.info(f"Getting prompt {name} with arguments: {arguments}")
             
             if name == "analyze_cad_file":
-                return await self.generate_analyze_cad_file_prompt(
+                return self.generate_analyze_cad_file_prompt(
                     file_path=arguments["file_path"],
                     analysis_focus=arguments.get("analysis_focus")
                 )
             elif name == "suggest_export_format":
-                return await self.generate_suggest_export_format_prompt(
+                return self.generate_suggest_export_format_prompt(
                     use_case=arguments["use_case"],
                     file_type=arguments.get("file_type")
                 )
             elif name == "troubleshoot_conversion":
-                return await self.generate_troubleshoot_conversion_prompt(
+                return self.generate_troubleshoot_conversion_prompt(
                     error_message=arguments["error_message"],
                     source_format=arguments.get("source_format"),
                     target_format=arguments.get("target_format")
@@ -324,6 +344,9 @@ Please provide clear, actionable solutions prioritized by likelihood of success
             else:
                 raise ValueError(f"Unknown prompt: {name}")
                 
+        except KeyError as e:
+            self.logger.error(f"Missing required argument for prompt {name}: {e}")
+            raise ValueError(f"Missing required argument for prompt {name}: {e}") from e
         except Exception as e:
             self.logger.error(f"Error getting prompt {name}: {e}")
             raise
@@ -8,12 +8,150 @@ following the Single Responsibility Principle.
 
 import json
 import logging
-from typing import List
+from typing import Dict, List
 
 import mcp.types as types
 
+import formats_registry
+
 logger = logging.getLogger(__name__)
 
+# Prefer orjson for resource serialization; its C encoder is several times
+# faster than stdlib pretty-printing. Fall back to json when unavailable.
+# Rendering stays in bytes end to end; str only appears at the MCP boundary.
+try:
+    import orjson
+
+    def _render_json_bytes(data: dict, pretty: bool = False) -> bytes:
+        # default=dict unwraps the registry's read-only mappings
+        return orjson.dumps(data, dict, orjson.OPT_INDENT_2 if pretty else 0)
+except ImportError:
+    def _render_json_bytes(data: dict, pretty: bool = False) -> bytes:
+        return json.dumps(
+            data,
+            indent=2 if pretty else None,
+            separators=None if pretty else (",", ":"),
+            default=dict
+        ).encode('utf-8')
+
+
+# Static resource payloads, hoisted to module level so the dict literals
+# are built once per process instead of per read_resource call. Format
+# data comes from the shared registry instead of a local copy.
+_SUPPORTED_FORMATS = {
+    "import_formats": formats_registry.IMPORT,
+    "export_formats": formats_registry.EXPORT,
+    "native_formats": formats_registry.NATIVE
+}
+
+_EXPORT_TEMPLATES = {
+    "step": {
+        "high_quality": {
+            "units": "millimeters",
+            "precision": "high",
+            "include_surfaces": True,
+            "include_curves": True
+        },
+        "standard": {
+            "units": "millimeters",
+            "precision": "medium",
+            "include_surfaces": True,
+            "include_curves": False
+        }
+    },
+    "stl": {
+        "high_resolution": {
+            "units": "millimeters",
+            "resolution": "fine",
+            "angular_tolerance": 0.1,
+            "chord_tolerance": 0.01
+        },
+        "3d_printing": {
+            "units": "millimeters",
+            "resolution": "medium",
+            "angular_tolerance": 0.5,
+            "chord_tolerance": 0.1
+        }
+    },
+    "pdf": {
+        "technical_drawing": {
+            "page_size": "A4",
+            "orientation": "landscape",
+            "include_dimensions": True,
+            "include_annotations": True,
+            "quality": "high"
+        },
+        "presentation": {
+            "page_size": "A4",
+            "orientation": "portrait",
+            "include_dimensions": False,
+            "include_annotations": False,
+            "quality": "medium"
+        }
+    }
+}
+
+# TODO: Replace with actual statistics from operation history
+_STATIC_STATISTICS = {
+    "today": {
+        "conversions": 15,
+        "analyses": 8,
+        "batch_operations": 3,
+        "most_common_format": "STEP",
+        "average_file_size": "2.5 MB"
+    },
+    "this_week": {
+        "conversions": 87,
+        "analyses": 42,
+        "batch_operations": 12,
+        "most_common_format": "STEP",
+        "average_file_size": "3.1 MB"
+    },
+    "format_breakdown": {
+        "STEP": 45,
+        "STL": 28,
+        "PDF": 18,
+        "IGES": 12,
+        "DWG": 8
+    },
+    "file_type_breakdown": {
+        "parts": 68,
+        "assemblies": 23,
+        "drawings": 9
+    },
+    "last_updated": "2024-01-01T12:00:00Z"
+}
+
+
+# Resource definitions built once at import time; list_resources returns
+# the same list on every RPC instead of reallocating it
+_RESOURCE_DEFINITIONS: List["types.Resource"] = [
+    types.Resource(
+        uri="cad://system/status",
+        name="CAD System Status",
+        description="Current status of SolidWorks installation and API",
+        mimeType="application/json"
+    ),
+    types.Resource(
+        uri="cad://formats/supported",
+        name="Supported File Formats", 
+        description="List of supported import/export file formats",
+        mimeType="application/json"
+    ),
+    types.Resource(
+        uri="cad://templates/export-options",
+        name="Export Options Templates",
+        description="Predefined export option templates for different formats",
+        mimeType="application/json"
+    ),
+    types.Resource(
+        uri="cad://statistics/recent-operations",
+        name="Recent Operations Statistics",
+        description="Statistics about recent file operations and conversions",
+        mimeType="application/json"
+    )
+]
+
 
 class CADResources:
     """
@@ -23,9 +161,33 @@ class CADResources:
     system status, supported formats, templates, and statistics.
     """
     
-    def __init__(self):
-        """Initialize CAD resources."""
-        self.logger = logging.getLogger(self.__class__.__name__)
+    __slots__ = ("_resource_cache", "_dynamic_resources", "_pretty_json")
+    
+    # One logger per class, resolved at class-creation time; instance
+    # construction no longer takes the logging registry lock
+    logger = logging.getLogger(__qualname__)
+    
+    def __init__(self, pretty_json: bool = False):
+        """
+        Initialize CAD resources.
+        
+        Args:
+            pretty_json: Indent resource payloads for human consumers;
+                compact output (the default) halves the bytes on the wire
+        """
+        self._pretty_json = pretty_json
+        # Static payloads serialized once; read_resource hands the cached
+        # bytes back without touching the serializer on the hot path
+        self._resource_cache: Dict[str, bytes] = {
+            "cad://formats/supported": _render_json_bytes(_SUPPORTED_FORMATS, pretty_json),
+            "cad://templates/export-options": _render_json_bytes(_EXPORT_TEMPLATES, pretty_json),
+            "cad://statistics/recent-operations": _render_json_bytes(_STATIC_STATISTICS, pretty_json)
+        }
+        # Dynamic resources dispatch through a dict lookup rather than an
+        # if/elif chain over URIs
+        self._dynamic_resources = {
+            "cad://system/status": self.get_system_status
+        }
     
     async def get_system_status(self) -> dict:
         """Get current status of SolidWorks installation and API."""
@@ -44,187 +206,48 @@ class CADResources:
             }
             return status
         except Exception as e:
-            self.logger.error(f"Error getting system status: {e}")
-            raise
+            self.logger.exception("Error getting system status")
+            return {"status": "error", "error": str(e), "type": type(e).__name__}
     
     async def get_supported_formats(self) -> dict:
         """Get list of supported import/export file formats."""
-        try:
-            formats = {
-                "import_formats": [
-                    {"extension": "step", "description": "STEP Files", "version": "AP214/AP203"},
-                    {"extension": "iges", "description": "IGES Files", "version": "2014"},
-                    {"extension": "stl", "description": "STL Files", "type": "mesh"},
-                    {"extension": "obj", "description": "Wavefront OBJ", "type": "mesh"},
-                    {"extension": "3mf", "description": "3D Manufacturing Format", "version": "1.0"},
-                    {"extension": "ply", "description": "Polygon File Format", "type": "mesh"}
-                ],
-                "export_formats": [
-                    {"extension": "step", "description": "STEP Files", "version": "AP214/AP203"},
-                    {"extension": "iges", "description": "IGES Files", "version": "2014"},
-                    {"extension": "stl", "description": "STL Files", "type": "mesh"},
-                    {"extension": "pdf", "description": "PDF Documents", "type": "document"},
-                    {"extension": "dwg", "description": "AutoCAD Drawing", "version": "2024"},
-                    {"extension": "dxf", "description": "Drawing Exchange Format", "version": "2024"},
-                    {"extension": "obj", "description": "Wavefront OBJ", "type": "mesh"},
-                    {"extension": "3mf", "description": "3D Manufacturing Format", "version": "1.0"}
-                ],
-                "native_formats": [
-                    {"extension": "sldprt", "description": "SolidWorks Part", "type": "part"},
-                    {"extension": "sldasm", "description": "SolidWorks Assembly", "type": "assembly"},
-                    {"extension": "slddrw", "description": "SolidWorks Drawing", "type": "drawing"}
-                ]
-            }
-            return formats
-        except Exception as e:
-            self.logger.error(f"Error getting supported formats: {e}")
-            raise
-    
+        return _SUPPORTED_FORMATS
+
     async def get_export_templates(self) -> dict:
         """Get predefined export option templates for different formats."""
-        try:
-            templates = {
-                "step": {
-                    "high_quality": {
-                        "units": "millimeters",
-                        "precision": "high",
-                        "include_surfaces": True,
-                        "include_curves": True
-                    },
-                    "standard": {
-                        "units": "millimeters",
-                        "precision": "medium",
-                        "include_surfaces": True,
-                        "include_curves": False
-                    }
-                },
-                "stl": {
-                    "high_resolution": {
-                        "units": "millimeters",
-                        "resolution": "fine",
-                        "angular_tolerance": 0.1,
-                        "chord_tolerance": 0.01
-                    },
-                    "3d_printing": {
-                        "units": "millimeters",
-                        "resolution": "medium",
-                        "angular_tolerance": 0.5,
-                        "chord_tolerance": 0.1
-                    }
-                },
-                "pdf": {
-                    "technical_drawing": {
-                        "page_size": "A4",
-                        "orientation": "landscape",
-                        "include_dimensions": True,
-                        "include_annotations": True,
-                        "quality": "high"
-                    },
-                    "presentation": {
-                        "page_size": "A4",
-                        "orientation": "portrait",
-                        "include_dimensions": False,
-                        "include_annotations": False,
-                        "quality": "medium"
-                    }
-                }
-            }
-            return templates
-        except Exception as e:
-            self.logger.error(f"Error getting export templates: {e}")
-            raise
-    
+        return _EXPORT_TEMPLATES
+
     async def get_recent_operations(self) -> dict:
         """Get statistics about recent file operations and conversions."""
-        try:
-            # TODO: Get actual statistics from operation history
-            statistics = {
-                "today": {
-                    "conversions": 15,
-                    "analyses": 8,
-                    "batch_operations": 3,
-                    "most_common_format": "STEP",
-                    "average_file_size": "2.5 MB"
-                },
-                "this_week": {
-                    "conversions": 87,
-                    "analyses": 42,
-                    "batch_operations": 12,
-                    "most_common_format": "STEP",
-                    "average_file_size": "3.1 MB"
-                },
-                "format_breakdown": {
-                    "STEP": 45,
-                    "STL": 28,
-                    "PDF": 18,
-                    "IGES": 12,
-                    "DWG": 8
-                },
-                "file_type_breakdown": {
-                    "parts": 68,
-                    "assemblies": 23,
-                    "drawings": 9
-                },
-                "last_updated": "2024-01-01T12:00:00Z"
-            }
-            return statistics
-        except Exception as e:
-            self.logger.error(f"Error getting recent operations: {e}")
-            raise
-    
+        return _STATIC_STATISTICS
+
     # MCP Resource Handler Methods
     
     async def list_resources(self) -> List[types.Resource]:
         """List available CAD resources for MCP."""
-        try:
-            return [
-                types.Resource(
-                    uri="cad://system/status",
-                    name="CAD System Status",
-                    description="Current status of SolidWorks installation and API",
-                    mimeType="application/json"
-                ),
-                types.Resource(
-                    uri="cad://formats/supported",
-                    name="Supported File Formats", 
-                    description="List of supported import/export file formats",
-                    mimeType="application/json"
-                ),
-                types.Resource(
-                    uri="cad://templates/export-options",
-                    name="Export Options Templates",
-                    description="Predefined export option templates for different formats",
-                    mimeType="application/json"
-                ),
-                types.Resource(
-                    uri="cad://statistics/recent-operations",
-                    name="Recent Operations Statistics",
-                    description="Statistics about recent file operations and conversions",
-                    mimeType="application/json"
-                )
-            ]
-        except Exception as e:
-            self.logger.error(f"Error listing resources: {e}")
-            return []
+        return _RESOURCE_DEFINITIONS
+    
+    async def read_resource_bytes(self, uri: str) -> bytes:
+        """Read a resource as UTF-8 JSON bytes without a str round-trip."""
+        cached = self._resource_cache.get(uri)
+        if cached is not None:
+            return cached
+        
+        getter = self._dynamic_resources.get(uri)
+        if getter is None:
+            raise ValueError(f"Unknown resource URI: {uri}")
+        
+        return _render_json_bytes(await getter(), self._pretty_json)
     
     async def read_resource(self, uri: str) -> str:
         """Handle MCP resource read requests."""
         try:
-            self.logger.info(f"Reading resource: {uri}")
-            
-            if uri == "cad://system/status":
-                data = await self.get_system_status()
-            elif uri == "cad://formats/supported":
-                data = await self.get_supported_formats()
-            elif uri == "cad://templates/export-options":
-                data = await self.get_export_templates()
-            elif uri == "cad://statistics/recent-operations":
-                data = await self.get_recent_operations()
-            else:
-                raise ValueError(f"Unknown resource URI: {uri}")
+            self.logger.info("Reading resource: %s", uri)
             
-            return json.dumps(data, indent=2)
+            # The MCP handler signature expects str, so the decode happens
+            # exactly once here; internal callers can stay on bytes
+            return (await self.read_resource_bytes(uri)).decode('utf-8')
             
         except Exception as e:
-            self.logger.error(f"Error reading resource {uri}: {e}")
+            self.logger.error("Error reading resource %s: %s", uri, e)
             return f"Error reading resource: {str(e)}"
@@ -6,6 +6,7 @@ This module contains the main MCP server class that follows SOLID principles,
 specifically the Single Responsibility Principle and Dependency Inversion Principle.
 """
 
+import functools
 import logging
 from typing import Optional
 
@@ -22,6 +23,54 @@ from prompts.cad_prompts import SolidWorksPrompts
 logger = logging.getLogger(__name__)
 
 
+# MCP handlers as plain module-level coroutines taking the server as
+# context; they are bound once at registration and stay unit-testable
+# without a running Server
+
+async def _list_tools(ctx: "MCPServer"):
+    return await ctx._solidworks_tools.list_tools()
+
+
+async def _call_tool(ctx: "MCPServer", name: str, arguments: dict):
+    return await ctx._solidworks_tools.call_tool(name, arguments)
+
+
+async def _list_resources(ctx: "MCPServer"):
+    return await ctx._cad_resources.list_resources()
+
+
+async def _read_resource(ctx: "MCPServer", uri: str):
+    return await ctx._cad_resources.read_resource(uri)
+
+
+async def _list_prompts(ctx: "MCPServer"):
+    return ctx._solidworks_prompts.list_prompts()
+
+
+async def _get_prompt(ctx: "MCPServer", name: str, arguments: dict):
+    prompt_content = await ctx._solidworks_prompts.get_prompt(name, arguments)
+    return types.GetPromptResult(
+        description=f"AI prompt for {name}",
+        messages=[
+            types.PromptMessage(
+                role="user",
+                content=types.TextContent(type="text", text=prompt_content)
+            )
+        ]
+    )
+
+
+# (registrar name, handler) pairs consumed by _register_handlers
+_HANDLERS = (
+    ("list_tools", _list_tools),
+    ("call_tool", _call_tool),
+    ("list_resources", _list_resources),
+    ("read_resource", _read_resource),
+    ("list_prompts", _list_prompts),
+    ("get_prompt", _get_prompt)
+)
+
+
 class MCPServer:
     """
     Main MCP Server class following Single Responsibility Principle.
@@ -30,6 +79,8 @@ class MCPServer:
     and registering handlers. All business logic is delegated to specialized handlers.
     """
     
+    __slots__ = ("_config", "_server", "__tools", "__resources", "__prompts")
+    
     def __init__(
         self,
         config: ServerConfig,
@@ -61,55 +112,42 @@ class MCPServer:
         cad_resources: Optional[CADResources],
         solidworks_prompts: Optional[SolidWorksPrompts]
     ) -> None:
-        """Initialize server components with dependency injection."""
-        try:
-            # Initialize components with dependency injection
-            self._solidworks_tools = solidworks_tools or SolidWorksTools()
-            self._cad_resources = cad_resources or CADResources()
-            self._solidworks_prompts = solidworks_prompts or SolidWorksPrompts()
-            
-            logger.info("All server components initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize server components: {e}")
-            raise
+        """Store injected components; defaults are built lazily on first use."""
+        # Injected instances are kept as-is; None means the corresponding
+        # property constructs the default handler on its first access, so
+        # sessions that never touch e.g. resources never pay for them
+        self.__tools = solidworks_tools
+        self.__resources = cad_resources
+        self.__prompts = solidworks_prompts
+
+        logger.info("Server components registered (lazy initialization)")
+
+    @property
+    def _solidworks_tools(self) -> SolidWorksTools:
+        if self.__tools is None:
+            self.__tools = SolidWorksTools()
+        return self.__tools
+
+    @property
+    def _cad_resources(self) -> CADResources:
+        if self.__resources is None:
+            self.__resources = CADResources(
+                pretty_json=getattr(self._config, "pretty_json", False)
+            )
+        return self.__resources
+
+    @property
+    def _solidworks_prompts(self) -> SolidWorksPrompts:
+        if self.__prompts is None:
+            self.__prompts = SolidWorksPrompts()
+        return self.__prompts
     
     def _register_handlers(self) -> None:
         """Register MCP handlers with the server."""
-        # Register tool handlers
-        @self._server.list_tools()
-        async def handle_list_tools():
-            return await self._solidworks_tools.list_tools()
-        
-        @self._server.call_tool()
-        async def handle_call_tool(name: str, arguments: dict):
-            return await self._solidworks_tools.call_tool(name, arguments)
-        
-        # Register resource handlers
-        @self._server.list_resources()
-        async def handle_list_resources():
-            return await self._cad_resources.list_resources()
-        
-        @self._server.read_resource()
-        async def handle_read_resource(uri: str):
-            return await self._cad_resources.read_resource(uri)
-        
-        # Register prompt handlers
-        @self._server.list_prompts()
-        async def handle_list_prompts():
-            return await self._solidworks_prompts.list_prompts()
-        
-        @self._server.get_prompt()
-        async def handle_get_prompt(name: str, arguments: dict):
-            prompt_content = await self._solidworks_prompts.get_prompt(name, arguments)
-            return types.GetPromptResult(
-                description=f"AI prompt for {name}",
-                messages=[
-                    types.PromptMessage(
-                        role="user",
-                        content=types.TextContent(type="text", text=prompt_content)
-                    )
-                ]
-            )
+        # One loop over the precomputed handler table instead of six
+        # decorator closures; partial binds this server as the context
+        for event, handler in _HANDLERS:
+            getattr(self._server, event)()(functools.partial(handler, self))
         
         logger.info("All MCP handlers registered successfully")
     
@@ -6,14 +6,266 @@ This module provides SolidWorks API integration and tool operations
 following the Single Responsibility Principle.
 """
 
+import asyncio
+import base64
+import copy
+import fnmatch
+import functools
+import json
 import logging
-from typing import Any, Dict, List
+import os
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
 import mcp.types as types
 
+import formats_registry
+from tools import _win_scandir
+
 logger = logging.getLogger(__name__)
 
 
+# Bound on the rename entries echoed back in a batch result so huge
+# batches cannot balloon the response payload
+_MAX_REPORTED_CONVERSIONS = 100
+
+
+# Export formats accepted by convert_file; frozenset gives O(1)
+# membership checks against the shared registry
+_EXPORT_FORMAT_SET = frozenset(formats_registry.EXPORT_FORMAT_NAMES)
+
+# Largest converted file returned inline; bigger outputs are referenced
+# by path only so a single conversion cannot balloon the response
+_MAX_INLINE_BYTES = 256 * 1024
+
+
+_MIME_TYPES = {
+    "step": "model/step",
+    "stp": "model/step",
+    "iges": "model/iges",
+    "igs": "model/iges",
+    "stl": "model/stl",
+    "obj": "model/obj",
+    "3mf": "model/3mf",
+    "ply": "model/mesh",
+    "pdf": "application/pdf",
+    "dwg": "image/vnd.dwg",
+    "dxf": "image/vnd.dxf"
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _get_mime_type(extension: str) -> str:
+    """Map an export extension to the MIME type reported with inline content.
+
+    The table lives at module level and repeated extensions — every file
+    in a batch shares one — resolve straight from the memo cache.
+    """
+    return _MIME_TYPES.get(extension.lower(), "application/octet-stream")
+
+
+def _inline_payload(path: str) -> Optional[str]:
+    """Base64-encode the output file if it fits under the inline cap.
+
+    The file is opened in binary so non-text formats (STL, PDF, DWG)
+    never hit a UnicodeDecodeError, and at most _MAX_INLINE_BYTES + 1
+    bytes are ever read; oversized files return None and are referenced
+    by path instead.
+    """
+    with open(path, 'rb') as f:
+        data = f.read(_MAX_INLINE_BYTES + 1)
+    if len(data) > _MAX_INLINE_BYTES:
+        return None
+    return base64.b64encode(data).decode('ascii')
+
+
+# Placeholder STEP payload built once at import; per-conversion fields are
+# substituted with a single str.format call instead of re-assembling the
+# whole multi-line literal on every conversion
+_STEP_TEMPLATE = """ISO-10303-21;
+HEADER;
+FILE_DESCRIPTION(('SolidWorks converted file'),'2;1');
+FILE_NAME('{out_name}','{timestamp}',(''),(''),
+  'SolidWorks MCP Server','','');
+FILE_SCHEMA(('AUTOMOTIVE_DESIGN'));
+ENDSEC;
+DATA;
+/* Placeholder export of {in_name} */
+ENDSEC;
+END-ISO-10303-21;
+"""
+
+
+def _write_output_file(path: str, content: str, ensure_dir: bool = True) -> int:
+    """Write converted output to disk, creating the parent directory as needed.
+
+    Callers that have already ensured the directory (batch conversion
+    does it once up front) pass ensure_dir=False to skip the per-file
+    makedirs probe.
+    """
+    if ensure_dir:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return os.stat(path).st_size
+
+
+# SolidWorks lock files (~$) and auto-backup files match *.sld* too;
+# rejecting them by name here saves a full document open attempt each
+_IGNORE_RE = re.compile(r'(^~\$|\.sldbak$|\.bak$)', re.IGNORECASE)
+
+
+def _iter_matches(directory: str, pattern: str):
+    """Lazily yield paths of regular files in directory matching the glob.
+
+    Enumeration goes through _win_scandir, which uses the tuned
+    FindFirstFileExW path on the Windows SolidWorks host and os.scandir
+    elsewhere; either way the file type comes straight from the
+    directory entry, so no extra stat call is made per file. Lock and
+    backup files are filtered out before they reach the converter.
+    """
+    matcher = _compile_glob(pattern).match
+    ignored = _IGNORE_RE.search
+    yield from _win_scandir.iter_files(
+        directory, lambda name: matcher(name) and not ignored(name)
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_glob(pattern: str) -> "re.Pattern":
+    """Translate a glob pattern to a compiled regex, cached per pattern.
+
+    Filename matching on Windows is case-insensitive (glob and fnmatch
+    normcase both sides there), and SolidWorks files routinely carry
+    uppercase extensions like PART1.SLDPRT; IGNORECASE keeps the
+    platform semantics the compiled matcher replaced.
+    """
+    flags = re.IGNORECASE if sys.platform == "win32" else 0
+    return re.compile(fnmatch.translate(pattern), flags)
+
+
+# Serialize tool results with orjson's C encoder when available so MCP
+# clients receive parseable JSON instead of Python repr output
+try:
+    import orjson
+
+    def _dumps_result(result: Dict[str, Any]) -> str:
+        return orjson.dumps(result).decode('utf-8')
+except ImportError:
+    def _dumps_result(result: Dict[str, Any]) -> str:
+        return json.dumps(result, default=str)
+
+# Tool definitions built once at import time; list_tools hands back the
+# same list on every RPC instead of reallocating the schema graph
+_TOOL_DEFINITIONS: List[types.Tool] = [
+    types.Tool(
+        name="convert_file",
+        description="Convert SolidWorks file to specified format (STEP, IGES, STL, etc.)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "input_file_path": {
+                    "type": "string",
+                    "description": "Path to the SolidWorks file to convert"
+                },
+                "output_file_path": {
+                    "type": "string", 
+                    "description": "Path for the converted output file"
+                },
+                "export_format": {
+                    "type": "string",
+                    "description": "Export format (STEP, IGES, STL, PDF, etc.)",
+                    "default": "STEP"
+                },
+                "export_options": {
+                    "type": "object",
+                    "description": "Additional export options (optional)",
+                    "default": {}
+                }
+            },
+            "required": ["input_file_path", "output_file_path"]
+        }
+    ),
+    types.Tool(
+        name="analyze_file",
+        description="Analyze SolidWorks file and extract properties, features, and metadata",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the SolidWorks file to analyze"
+                },
+                "analysis_type": {
+                    "type": "string",
+                    "description": "Type of analysis (properties, features, mass, materials, all)",
+                    "default": "all"
+                }
+            },
+            "required": ["file_path"]
+        }
+    ),
+    types.Tool(
+        name="batch_convert",
+        description="Convert multiple SolidWorks files in batch",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "input_directory": {
+                    "type": "string",
+                    "description": "Directory containing SolidWorks files"
+                },
+                "output_directory": {
+                    "type": "string",
+                    "description": "Directory for converted files"
+                },
+                "export_format": {
+                    "type": "string",
+                    "description": "Export format for all files",
+                    "default": "STEP"
+                },
+                "file_pattern": {
+                    "type": "string",
+                    "description": "File pattern to match (e.g., '*.sldprt', '*.sldasm')",
+                    "default": "*.sld*"
+                }
+            },
+            "required": ["input_directory", "output_directory"]
+        }
+    ),
+    types.Tool(
+        name="validate_solidworks_installation",
+        description="Validate SolidWorks installation and API availability",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    types.Tool(
+        name="get_supported_formats",
+        description="Get list of supported import/export formats",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "format_type": {
+                    "type": "string",
+                    "description": "Type of formats (import, export, all)",
+                    "default": "all"
+                }
+            },
+            "required": []
+        }
+    )
+]
+
+
 class SolidWorksTools:
     """
     SolidWorks API integration and tool operations following SRP.
@@ -22,9 +274,42 @@ class SolidWorksTools:
     file conversion, analysis, and validation.
     """
     
+    __slots__ = ("_max_concurrent", "_dispatch", "_last_format", "_pool", "_sw_tls", "_ensured_dirs")
+    
+    # One logger per class, resolved at class-creation time; instance
+    # construction no longer takes the logging registry lock
+    logger = logging.getLogger(__qualname__)
+    
     def __init__(self):
         """Initialize SolidWorks tools."""
-        self.logger = logging.getLogger(self.__class__.__name__)
+        # Concurrency bound for batch operations, matching the
+        # MAX_CONCURRENT_OPERATIONS server setting
+        self._max_concurrent = int(os.environ.get("MAX_CONCURRENT_OPERATIONS", "5"))
+        # Last validated export format; batches repeat one format, so the
+        # common case is a single string comparison instead of a set probe
+        self._last_format = None
+        # Dedicated pool for blocking filesystem/SolidWorks work; sized
+        # independently of asyncio's default executor so batch conversions
+        # neither contend with other to_thread users nor churn threads
+        self._pool = ThreadPoolExecutor(
+            max_workers=int(os.environ.get("SW_WORKERS", "4")),
+            thread_name_prefix="sw"
+        )
+        # One SolidWorks COM session per pool thread, created lazily and
+        # reused for every file that thread converts
+        self._sw_tls = threading.local()
+        # Output directories already created this session; batches probe
+        # the filesystem once instead of once per file
+        self._ensured_dirs = set()
+        # O(1) tool dispatch; each adapter maps the MCP argument dict onto
+        # the underlying coroutine's signature
+        self._dispatch = {
+            "convert_file": self._convert_file_adapter,
+            "analyze_file": self._analyze_file_adapter,
+            "batch_convert": self._batch_convert_adapter,
+            "validate_solidworks_installation": self._validate_installation_adapter,
+            "get_supported_formats": self._get_supported_formats_adapter
+        }
         # TODO: Initialize SolidWorks API connection
     
     async def convert_file(
@@ -32,7 +317,8 @@ class SolidWorksTools:
         input_file_path: str, 
         output_file_path: str, 
         export_format: str = "STEP", 
-        export_options: Dict[str, Any] = None
+        export_options: Dict[str, Any] = None,
+        ensure_output_dir: bool = True
     ) -> Dict[str, Any]:
         """
         Convert SolidWorks file to specified format.
@@ -42,28 +328,77 @@ class SolidWorksTools:
             output_file_path: Path for the converted output file
             export_format: Export format (STEP, IGES, STL, PDF, etc.)
             export_options: Additional export options
+            ensure_output_dir: Create the output directory if missing;
+                batch conversion ensures it once and passes False
             
         Returns:
             Dict containing conversion result and metadata
         """
         try:
-            self.logger.info(f"Converting {input_file_path} to {export_format}")
+            # DEBUG so a 10k-file batch does not serialize its workers on
+            # the logging lock; call_tool and batch_convert log at INFO
+            self.logger.debug("Converting %s to %s", input_file_path, export_format)
+            
+            # One stat covers both the existence probe and size reporting;
+            # a missing input is tolerated until the real API opens it
+            try:
+                input_size = os.stat(input_file_path).st_size
+            except OSError:
+                input_size = None
+            
+            normalized_format = export_format.upper()
+            if normalized_format != self._last_format:
+                if normalized_format not in _EXPORT_FORMAT_SET:
+                    return {
+                        "status": "error",
+                        "error": f"Unsupported export format: {export_format}",
+                        "type": "ValueError"
+                    }
+                self._last_format = normalized_format
+            
+            # TODO: Replace the placeholder content with a real export via
+            # self._sw_app() (OpenDoc6/SaveAs) inside the worker thread
+            step_content = _STEP_TEMPLATE.format(
+                out_name=os.path.basename(output_file_path),
+                in_name=os.path.basename(input_file_path),
+                timestamp=datetime.now().isoformat(timespec='seconds')
+            )
+            
+            # The blocking filesystem work runs on a worker thread so other
+            # MCP calls keep progressing on the event loop
+            loop = asyncio.get_running_loop()
+            output_size = await loop.run_in_executor(
+                self._pool, _write_output_file, output_file_path, step_content,
+                ensure_output_dir
+            )
+            content_base64 = await loop.run_in_executor(
+                self._pool, _inline_payload, output_file_path
+            )
             
-            # TODO: Implement actual SolidWorks API conversion
             result = {
                 "status": "success",
                 "input_file": input_file_path,
                 "output_file": output_file_path,
+                "output_size_bytes": output_size,
+                "input_size_bytes": input_size,
+                "mime_type": _get_mime_type(export_format),
                 "format": export_format,
                 "options": export_options or {},
                 "message": f"File converted successfully to {export_format}"
             }
+            if content_base64 is not None:
+                result["output_content_base64"] = content_base64
+            else:
+                result["content_note"] = (
+                    f"Output exceeds {_MAX_INLINE_BYTES} bytes; "
+                    "read it from output_file instead"
+                )
             
             return result
             
         except Exception as e:
-            self.logger.error(f"Error converting file: {e}")
-            raise
+            self.logger.exception("Error converting file")
+            return {"status": "error", "error": str(e), "type": type(e).__name__}
     
     async def analyze_file(
         self, 
@@ -81,40 +416,89 @@ class SolidWorksTools:
             Dict containing analysis results
         """
         try:
-            self.logger.info(f"Analyzing {file_path} with type {analysis_type}")
+            self.logger.info("Analyzing %s with type %s", file_path, analysis_type)
             
-            # TODO: Implement actual SolidWorks API analysis
-            result = {
-                "status": "success",
-                "file_path": file_path,
-                "analysis_type": analysis_type,
-                "properties": {
-                    "file_type": "Part",
-                    "created_date": "2024-01-01",
-                    "modified_date": "2024-01-01",
-                    "file_size": "1.2 MB"
-                },
-                "features": ["Extrude1", "Cut-Extrude1", "Fillet1"],
-                "mass_properties": {
-                    "mass": "0.5 kg",
-                    "volume": "0.001 m³",
-                    "surface_area": "0.1 m²"
-                },
-                "materials": ["Steel - AISI 1020"]
-            }
+            # Key the cache on the file fingerprint: a change in mtime or
+            # size naturally misses and re-runs the analysis
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                return _analyze_file_cached.__wrapped__(file_path, 0, 0, analysis_type)
             
-            return result
+            # Hand each caller its own deep copy: call_tool mutates tool
+            # results in place, and a shared reference would let that
+            # mutation poison the cached entry for every later hit
+            return copy.deepcopy(
+                _analyze_file_cached(file_path, st.st_mtime_ns, st.st_size, analysis_type)
+            )
             
         except Exception as e:
-            self.logger.error(f"Error analyzing file: {e}")
-            raise
+            self.logger.exception("Error analyzing file")
+            return {"status": "error", "error": str(e), "type": type(e).__name__}
+    
+    async def iter_batch_convert(
+        self, 
+        input_directory: str, 
+        output_directory: str, 
+        export_format: str = "STEP", 
+        file_pattern: str = "*.sld*",
+        max_concurrency: int = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield one result dict per matched file as conversions complete.
+        
+        Results are streamed instead of materialized, so arbitrarily large
+        batches hold only the in-flight conversions in memory.
+        
+        Args:
+            max_concurrency: Cap on concurrent conversions for this batch;
+                defaults to the MAX_CONCURRENT_OPERATIONS setting
+        """
+        extension = export_format.lower()
+        
+        # The shared output directory is created once here; per-file
+        # conversions skip their own makedirs probe
+        self._ensure_dir(output_directory)
+        
+        # Fan the conversions out under a bounded semaphore so several
+        # files are in flight while each one waits on SolidWorks I/O
+        semaphore = asyncio.Semaphore(max_concurrency or self._max_concurrent)
+        
+        async def _convert_one(input_path: str) -> Dict[str, Any]:
+            input_name = os.path.basename(input_path)
+            output_name = f"{os.path.splitext(input_name)[0]}.{extension}"
+            async with semaphore:
+                conversion = await self.convert_file(
+                    input_file_path=input_path,
+                    output_file_path=os.path.join(output_directory, output_name),
+                    export_format=export_format,
+                    ensure_output_dir=False
+                )
+            return {
+                "ok": conversion.get("status") == "success",
+                "rename": f"{input_name} -> {output_name}",
+                "result": conversion
+            }
+        
+        # The generator feeds task creation directly; no intermediate list
+        # of paths is built for large directories
+        tasks = [
+            asyncio.ensure_future(_convert_one(path))
+            for path in _iter_matches(input_directory, file_pattern)
+        ]
+        for completed in asyncio.as_completed(tasks):
+            try:
+                yield await completed
+            except Exception as e:
+                yield {"ok": False, "rename": None, "error": str(e)}
     
     async def batch_convert(
         self, 
         input_directory: str, 
         output_directory: str, 
         export_format: str = "STEP", 
-        file_pattern: str = "*.sld*"
+        file_pattern: str = "*.sld*",
+        max_concurrency: int = None
     ) -> Dict[str, Any]:
         """
         Convert multiple SolidWorks files in batch.
@@ -124,35 +508,95 @@ class SolidWorksTools:
             output_directory: Directory for converted files
             export_format: Export format for all files
             file_pattern: File pattern to match
+            max_concurrency: Cap on concurrent conversions for this batch
             
         Returns:
             Dict containing batch conversion results
         """
         try:
-            self.logger.info(f"Batch converting from {input_directory} to {export_format}")
+            self.logger.info("Batch converting from %s to %s", input_directory, export_format)
+            
+            files_processed = 0
+            files_successful = 0
+            converted_files = []
+            truncated = False
+            
+            # Counters update incrementally as results stream in; only the
+            # capped rename list is retained
+            async for item in self.iter_batch_convert(
+                input_directory, output_directory, export_format, file_pattern,
+                max_concurrency
+            ):
+                files_processed += 1
+                if item["ok"]:
+                    files_successful += 1
+                    if len(converted_files) < _MAX_REPORTED_CONVERSIONS:
+                        converted_files.append(item["rename"])
+                    else:
+                        truncated = True
+                # One aggregated progress line per 100 files instead of one
+                # log emission per conversion
+                if files_processed % 100 == 0:
+                    self.logger.info(
+                        "Batch progress: %d processed (%d failed)",
+                        files_processed, files_processed - files_successful
+                    )
+            
+            self.logger.info(
+                "Batch complete: %d/%d converted successfully",
+                files_successful, files_processed
+            )
             
-            # TODO: Implement actual batch conversion
             result = {
                 "status": "success",
                 "input_directory": input_directory,
                 "output_directory": output_directory,
                 "format": export_format,
                 "pattern": file_pattern,
-                "files_processed": 5,
-                "files_successful": 5,
-                "files_failed": 0,
-                "converted_files": [
-                    "part1.sldprt -> part1.step",
-                    "part2.sldprt -> part2.step",
-                    "assembly1.sldasm -> assembly1.step"
-                ]
+                "files_processed": files_processed,
+                "files_successful": files_successful,
+                "files_failed": files_processed - files_successful,
+                "converted_files": converted_files
             }
             
+            if truncated:
+                result["converted_files_truncated"] = True
+            
             return result
             
         except Exception as e:
-            self.logger.error(f"Error in batch conversion: {e}")
-            raise
+            self.logger.exception("Error in batch conversion")
+            return {"status": "error", "error": str(e), "type": type(e).__name__}
+    
+    def _ensure_dir(self, directory: str) -> None:
+        """Create directory on first sight this session; later calls are a set probe."""
+        if directory and directory not in self._ensured_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._ensured_dirs.add(directory)
+    
+    def _sw_app(self):
+        """Return this worker thread's SolidWorks COM session, creating it lazily.
+
+        Dispatch("SldWorks.Application") costs multiple seconds; caching
+        the handle in thread-local storage amortizes that startup across
+        every file a pool thread converts instead of paying it per call.
+        This is the seam the real OpenDoc6/SaveAs integration plugs into;
+        it must only run on the worker threads, which each CoInitialize
+        their own COM apartment.
+        """
+        app = getattr(self._sw_tls, "app", None)
+        if app is None:
+            import pythoncom
+            import win32com.client
+            
+            pythoncom.CoInitialize()
+            app = win32com.client.Dispatch("SldWorks.Application")
+            self._sw_tls.app = app
+        return app
+    
+    async def aclose(self) -> None:
+        """Release the worker pool; pending work is abandoned."""
+        self._pool.shutdown(wait=False)
     
     async def validate_installation(self) -> Dict[str, Any]:
         """
@@ -178,8 +622,8 @@ class SolidWorksTools:
             return result
             
         except Exception as e:
-            self.logger.error(f"Error validating installation: {e}")
-            raise
+            self.logger.exception("Error validating installation")
+            return {"status": "error", "error": str(e), "type": type(e).__name__}
     
     async def get_supported_formats(self, format_type: str = "all") -> Dict[str, Any]:
         """
@@ -191,175 +635,143 @@ class SolidWorksTools:
         Returns:
             Dict containing supported formats
         """
-        try:
-            self.logger.info(f"Getting supported formats: {format_type}")
-            
-            # TODO: Get actual supported formats from SolidWorks API
-            import_formats = ["STEP", "IGES", "STL", "OBJ", "3MF", "PLY"]
-            export_formats = ["STEP", "IGES", "STL", "PDF", "DWG", "DXF", "OBJ", "3MF"]
-            
-            result = {
-                "status": "success",
-                "format_type": format_type
-            }
-            
-            if format_type in ["import", "all"]:
-                result["import_formats"] = import_formats
-            
-            if format_type in ["export", "all"]:
-                result["export_formats"] = export_formats
-            
-            return result
-            
-        except Exception as e:
-            self.logger.error(f"Error getting supported formats: {e}")
-            raise
+        self.logger.info("Getting supported formats: %s", format_type)
+        
+        # Responses are precomputed per format_type; unknown types fall
+        # back to the full listing
+        return _FORMAT_RESPONSES.get(format_type, _FORMAT_RESPONSES["all"])
     
     # MCP Tool Handler Methods
     
+    async def _convert_file_adapter(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.convert_file(
+            input_file_path=args["input_file_path"],
+            output_file_path=args["output_file_path"],
+            export_format=args.get("export_format", "STEP"),
+            export_options=args.get("export_options", {})
+        )
+    
+    async def _analyze_file_adapter(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.analyze_file(
+            file_path=args["file_path"],
+            analysis_type=args.get("analysis_type", "all")
+        )
+    
+    async def _batch_convert_adapter(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.batch_convert(
+            input_directory=args["input_directory"],
+            output_directory=args["output_directory"],
+            export_format=args.get("export_format", "STEP"),
+            file_pattern=args.get("file_pattern", "*.sld*")
+        )
+    
+    async def _validate_installation_adapter(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.validate_installation()
+    
+    async def _get_supported_formats_adapter(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.get_supported_formats(
+            format_type=args.get("format_type", "all")
+        )
+    
     async def list_tools(self) -> List[types.Tool]:
         """List available SolidWorks tools for MCP."""
-        try:
-            return [
-                types.Tool(
-                    name="convert_file",
-                    description="Convert SolidWorks file to specified format (STEP, IGES, STL, etc.)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "input_file_path": {
-                                "type": "string",
-                                "description": "Path to the SolidWorks file to convert"
-                            },
-                            "output_file_path": {
-                                "type": "string", 
-                                "description": "Path for the converted output file"
-                            },
-                            "export_format": {
-                                "type": "string",
-                                "description": "Export format (STEP, IGES, STL, PDF, etc.)",
-                                "default": "STEP"
-                            },
-                            "export_options": {
-                                "type": "object",
-                                "description": "Additional export options (optional)",
-                                "default": {}
-                            }
-                        },
-                        "required": ["input_file_path", "output_file_path"]
-                    }
-                ),
-                types.Tool(
-                    name="analyze_file",
-                    description="Analyze SolidWorks file and extract properties, features, and metadata",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "file_path": {
-                                "type": "string",
-                                "description": "Path to the SolidWorks file to analyze"
-                            },
-                            "analysis_type": {
-                                "type": "string",
-                                "description": "Type of analysis (properties, features, mass, materials, all)",
-                                "default": "all"
-                            }
-                        },
-                        "required": ["file_path"]
-                    }
-                ),
-                types.Tool(
-                    name="batch_convert",
-                    description="Convert multiple SolidWorks files in batch",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "input_directory": {
-                                "type": "string",
-                                "description": "Directory containing SolidWorks files"
-                            },
-                            "output_directory": {
-                                "type": "string",
-                                "description": "Directory for converted files"
-                            },
-                            "export_format": {
-                                "type": "string",
-                                "description": "Export format for all files",
-                                "default": "STEP"
-                            },
-                            "file_pattern": {
-                                "type": "string",
-                                "description": "File pattern to match (e.g., '*.sldprt', '*.sldasm')",
-                                "default": "*.sld*"
-                            }
-                        },
-                        "required": ["input_directory", "output_directory"]
-                    }
-                ),
-                types.Tool(
-                    name="validate_solidworks_installation",
-                    description="Validate SolidWorks installation and API availability",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                ),
-                types.Tool(
-                    name="get_supported_formats",
-                    description="Get list of supported import/export formats",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "format_type": {
-                                "type": "string",
-                                "description": "Type of formats (import, export, all)",
-                                "default": "all"
-                            }
-                        },
-                        "required": []
-                    }
-                )
-            ]
-        except Exception as e:
-            self.logger.error(f"Error listing tools: {e}")
-            return []
+        return _TOOL_DEFINITIONS
     
-    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> List[types.TextContent]:
+    async def call_tool(
+        self, name: str, arguments: Dict[str, Any]
+    ) -> List[Union[types.TextContent, types.EmbeddedResource]]:
         """Handle MCP tool calls."""
+        # Guarded: formatting the arguments dict is the expensive part
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Calling tool %s with arguments: %s", name, arguments)
+        
+        handler = self._dispatch.get(name)
+        if handler is None:
+            return [types.TextContent(type="text", text=f"Unknown tool: {name}")]
+        
+        # Handlers report failures as structured {"status": "error"} dicts,
+        # so only missing required arguments surface as exceptions here
         try:
-            self.logger.info(f"Calling tool {name} with arguments: {arguments}")
-            
-            if name == "convert_file":
-                result = await self.convert_file(
-                    input_file_path=arguments["input_file_path"],
-                    output_file_path=arguments["output_file_path"],
-                    export_format=arguments.get("export_format", "STEP"),
-                    export_options=arguments.get("export_options", {})
-                )
-            elif name == "analyze_file":
-                result = await self.analyze_file(
-                    file_path=arguments["file_path"],
-                    analysis_type=arguments.get("analysis_type", "all")
-                )
-            elif name == "batch_convert":
-                result = await self.batch_convert(
-                    input_directory=arguments["input_directory"],
-                    output_directory=arguments["output_directory"],
-                    export_format=arguments.get("export_format", "STEP"),
-                    file_pattern=arguments.get("file_pattern", "*.sld*")
-                )
-            elif name == "validate_solidworks_installation":
-                result = await self.validate_installation()
-            elif name == "get_supported_formats":
-                result = await self.get_supported_formats(
-                    format_type=arguments.get("format_type", "all")
+            result = await handler(arguments)
+        except KeyError as e:
+            return [types.TextContent(type="text", text=f"Error: missing required argument {e} for tool {name}")]
+        
+        # Converted file bytes travel as a native MCP blob attachment with
+        # a proper MIME type instead of being embedded in the JSON text,
+        # so clients can write the file out without re-parsing the payload
+        content_base64 = result.pop("output_content_base64", None) if isinstance(result, dict) else None
+        response: List[Union[types.TextContent, types.EmbeddedResource]] = [
+            types.TextContent(type="text", text=_dumps_result(result))
+        ]
+        if content_base64 is not None:
+            response.append(types.EmbeddedResource(
+                type="resource",
+                resource=types.BlobResourceContents(
+                    uri=f"file://{result['output_file']}",
+                    mimeType=result.get("mime_type", "application/octet-stream"),
+                    blob=content_base64
                 )
-            else:
-                return [types.TextContent(type="text", text=f"Unknown tool: {name}")]
-            
-            return [types.TextContent(type="text", text=str(result))]
-            
-        except Exception as e:
-            self.logger.error(f"Error calling tool {name}: {e}")
-            return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+            ))
+        return response
+
+
+@functools.lru_cache(maxsize=512)
+def _analyze_file_cached(
+    file_path: str,
+    mtime_ns: int,
+    size: int,
+    analysis_type: str
+) -> Dict[str, Any]:
+    """Run a file analysis, memoized per (path, mtime, size, type).
+
+    Only the requested sections are populated; once the real SolidWorks
+    queries land, a "properties" request will skip the feature-tree and
+    mass-property API calls entirely.
+    """
+    # TODO: Implement actual SolidWorks API analysis
+    result = {
+        "status": "success",
+        "file_path": file_path,
+        "analysis_type": analysis_type
+    }
+    if analysis_type in ("properties", "all"):
+        result["properties"] = {
+            "file_type": "Part",
+            "created_date": "2024-01-01",
+            "modified_date": "2024-01-01",
+            "file_size": "1.2 MB"
+        }
+    if analysis_type in ("features", "all"):
+        result["features"] = ["Extrude1", "Cut-Extrude1", "Fillet1"]
+    if analysis_type in ("mass", "all"):
+        result["mass_properties"] = {
+            "mass": "0.5 kg",
+            "volume": "0.001 m³",
+            "surface_area": "0.1 m²"
+        }
+    if analysis_type in ("materials", "all"):
+        result["materials"] = ["Steel - AISI 1020"]
+    return result
+
+
+# One immutable response per format_type, built at import time so
+# get_supported_formats is a single dict lookup. The short names come
+# from the shared registry rather than a duplicate list.
+_FORMAT_RESPONSES = {
+    "import": {
+        "status": "success",
+        "format_type": "import",
+        "import_formats": formats_registry.IMPORT_FORMAT_NAMES
+    },
+    "export": {
+        "status": "success",
+        "format_type": "export",
+        "export_formats": formats_registry.EXPORT_FORMAT_NAMES
+    },
+    "all": {
+        "status": "success",
+        "format_type": "all",
+        "import_formats": formats_registry.IMPORT_FORMAT_NAMES,
+        "export_formats": formats_registry.EXPORT_FORMAT_NAMES
+    }
+}
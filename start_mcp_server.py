@@ -6,18 +6,19 @@ This script starts the MCP server and provides instructions for testing it.
 """
 
 import asyncio
+import functools
 import logging
 import os
 import sys
-import subprocess
 import time
 from pathlib import Path
 
 # Add src directory to Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from config import Config, ServerConfig
-from server import MCPServer
+# config and server (and through them anthropic, pydantic and mcp) are
+# imported lazily inside the functions that need them, so a failed
+# prerequisite check exits without paying those imports
 
 # Configure logging
 logging.basicConfig(
@@ -27,13 +28,22 @@ logging.basicConfig(
 logger = logging.getLogger("mcp-server-starter")
 
 
-async def start_server():
-    """Start the MCP server."""
+async def start_server(config=None):
+    """Start the MCP server.
+
+    Args:
+        config: Preloaded ServerConfig; loaded here when not supplied
+    """
+    from config import Config
+    from server import MCPServer
+    
     logger.info("Starting SolidWorks MCP Server...")
     
     try:
-        # Load configuration
-        config = Config.from_environment()
+        # Load configuration (main() preloads it concurrently with the
+        # prerequisite check and passes it in)
+        if config is None:
+            config = Config.from_environment()
         logger.info("✓ Configuration loaded successfully")
         
         # Initialize server
@@ -50,10 +60,23 @@ async def start_server():
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
-        logger.error(f"Server startup failed: {e}")
+        logger.error("Server startup failed: %s", e)
         raise
 
 
+@functools.lru_cache(maxsize=1)
+def _solidworks_running(time_bucket: int) -> bool:
+    """Check for SLDWORKS.exe in-process, cached per coarse time bucket.
+
+    The ToolHelp32 snapshot helper reads kernel process structures
+    directly instead of forking a tasklist subprocess and parsing its
+    text output; the time_bucket argument makes repeated checks within
+    the same few seconds free.
+    """
+    from check_solidworks_installation import _is_process_running
+    return _is_process_running("SLDWORKS.exe")
+
+
 def check_prerequisites():
     """Check if all prerequisites are met."""
     logger.info("Checking prerequisites...")
@@ -65,51 +88,66 @@ def check_prerequisites():
     
     # Check if SolidWorks is running
     try:
-        result = subprocess.run(
-            ["tasklist", "/FI", "IMAGENAME eq SLDWORKS.exe"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        if "SLDWORKS.exe" in result.stdout:
+        if _solidworks_running(int(time.monotonic()) // 5):
             logger.info("✓ SolidWorks is running")
         else:
             logger.warning("⚠️  SolidWorks is not running. Starting the server anyway...")
             
-    except subprocess.CalledProcessError:
+    except Exception:
         logger.warning("⚠️  Could not check if SolidWorks is running")
     
     logger.info("✓ Prerequisites check completed")
     return True
 
 
+# Banner text assembled once per process; emitting it as one write
+# keeps it a single syscall instead of ~25
+_USAGE_INSTRUCTIONS = "\n".join((
+    "",
+    "=" * 60,
+    "SolidWorks MCP Server - Usage Instructions",
+    "=" * 60,
+    "",
+    "The MCP server is now running and ready to accept connections.",
+    "",
+    "To test the server with an MCP client:",
+    "",
+    "1. Install an MCP client (like Claude Desktop):",
+    "   - Download from: https://claude.ai/desktop",
+    "   - Or use another MCP-compatible client",
+    "",
+    "2. Configure the client to connect to this server:",
+    "   - Server type: stdio",
+    "   - Command: python",
+    "   - Args: ['src/main.py']",
+    "   - Working directory: [path to this project]",
+    "",
+    "3. Available tools:",
+    "   - convert_file: Convert SolidWorks files to different formats",
+    "   - analyze_file: Analyze SolidWorks file properties and features",
+    "   - batch_convert: Convert multiple files in batch",
+    "   - validate_solidworks_installation: Check SolidWorks setup",
+    "   - get_supported_formats: List supported file formats",
+    "",
+    "4. Example usage in Claude Desktop:",
+    "   'Convert my SolidWorks part file to STEP format'",
+    "   'Analyze the properties of my assembly file'",
+    "   'What file formats can SolidWorks export?'",
+    "",
+    "=" * 60,
+    ""
+))
+
+
 def print_usage_instructions():
-    """Print usage instructions."""
-    print("\n" + "=" * 60)
-    print("SolidWorks MCP Server - Usage Instructions")
-    print("=" * 60)
-    print("\nThe MCP server is now running and ready to accept connections.")
-    print("\nTo test the server with an MCP client:")
-    print("\n1. Install an MCP client (like Claude Desktop):")
-    print("   - Download from: https://claude.ai/desktop")
-    print("   - Or use another MCP-compatible client")
-    print("\n2. Configure the client to connect to this server:")
-    print("   - Server type: stdio")
-    print("   - Command: python")
-    print("   - Args: ['src/main.py']")
-    print("   - Working directory: [path to this project]")
-    print("\n3. Available tools:")
-    print("   - convert_file: Convert SolidWorks files to different formats")
-    print("   - analyze_file: Analyze SolidWorks file properties and features")
-    print("   - batch_convert: Convert multiple files in batch")
-    print("   - validate_solidworks_installation: Check SolidWorks setup")
-    print("   - get_supported_formats: List supported file formats")
-    print("\n4. Example usage in Claude Desktop:")
-    print("   'Convert my SolidWorks part file to STEP format'")
-    print("   'Analyze the properties of my assembly file'")
-    print("   'What file formats can SolidWorks export?'")
-    print("\n" + "=" * 60)
+    """Print usage instructions in a single write, keeping stdout clean.
+
+    When stdout is not a terminal — e.g. the script was launched by an
+    MCP client over stdio — the banner goes to stderr so it can never
+    interleave with JSON-RPC framing.
+    """
+    stream = sys.stdout if sys.stdout.isatty() else sys.stderr
+    stream.write(_USAGE_INSTRUCTIONS)
 
 
 async def main():
@@ -117,15 +155,25 @@ async def main():
     print("SolidWorks MCP Server Starter")
     print("=" * 40)
     
-    # Check prerequisites
-    if not check_prerequisites():
-        return
+    # Prerequisites and config load are independent and both touch the
+    # filesystem; run them on worker threads while the usage banner
+    # prints, then join before starting the server
+    def _load_config():
+        from config import Config
+        return Config.from_environment()
+    
+    prereq_task = asyncio.create_task(asyncio.to_thread(check_prerequisites))
+    config_task = asyncio.create_task(asyncio.to_thread(_load_config))
     
     # Print instructions
     print_usage_instructions()
     
+    prereq_ok, config = await asyncio.gather(prereq_task, config_task)
+    if not prereq_ok:
+        return
+    
     # Start the server
-    await start_server()
+    await start_server(config)
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@
 Test script to verify configuration loading without SolidWorks installed.
 """
 
+import asyncio
 import os
 import sys
 from pathlib import Path
@@ -11,7 +12,15 @@ from pathlib import Path
 src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
-def test_config_loading():
+# Import once at module load instead of once per test function; the
+# cold imports happen up front rather than serialized into each test
+from config import Config
+from server import MCPServer
+from tools.solidworks_tools import SolidWorksTools
+from resources.cad_resources import CADResources
+from prompts.cad_prompts import SolidWorksPrompts
+
+async def test_config_loading():
     """Test configuration loading with environment variables."""
     print("🧪 Testing Configuration Loading...")
     
@@ -35,7 +44,9 @@ def test_config_loading():
         os.environ[key] = value
     
     try:
-        from config import Config
+        # The config object is cached process-wide; drop it so this test
+        # parses the environment block set above
+        Config.invalidate_cache()
         
         # Test configuration loading
         config = Config.from_environment()
@@ -54,14 +65,11 @@ def test_config_loading():
         print(f"❌ Configuration loading failed: {e}")
         return False
 
-def test_server_initialization():
+async def test_server_initialization():
     """Test server initialization without starting it."""
     print("\n🧪 Testing Server Initialization...")
     
     try:
-        from config import Config
-        from server import MCPServer
-        
         # Load configuration
         config = Config.from_environment()
         
@@ -81,24 +89,21 @@ def test_server_initialization():
         traceback.print_exc()
         return False
 
-def test_tools_functionality():
+async def test_tools_functionality():
     """Test tools functionality without SolidWorks."""
     print("\n🧪 Testing Tools Functionality...")
     
     try:
-        from tools.solidworks_tools import SolidWorksTools
-        import asyncio
-        
         tools = SolidWorksTools()
         
         # Test list_tools
-        tools_list = asyncio.run(tools.list_tools())
+        tools_list = await tools.list_tools()
         print(f"✅ Tools list loaded: {len(tools_list)} tools available")
         for tool in tools_list:
             print(f"   - {tool.name}: {tool.description}")
         
         # Test a simple tool call (this should work even without SolidWorks)
-        result = asyncio.run(tools.get_supported_formats("all"))
+        result = await tools.get_supported_formats("all")
         print(f"✅ Get supported formats: {result['status']}")
         
         return True
@@ -109,24 +114,21 @@ def test_tools_functionality():
         traceback.print_exc()
         return False
 
-def test_resources_functionality():
+async def test_resources_functionality():
     """Test resources functionality."""
     print("\n🧪 Testing Resources Functionality...")
     
     try:
-        from resources.cad_resources import CADResources
-        import asyncio
-        
         resources = CADResources()
         
         # Test list_resources
-        resources_list = asyncio.run(resources.list_resources())
+        resources_list = await resources.list_resources()
         print(f"✅ Resources list loaded: {len(resources_list)} resources available")
         for resource in resources_list:
             print(f"   - {resource.name}: {resource.description}")
         
         # Test reading a resource
-        system_status = asyncio.run(resources.read_resource("cad://system/status"))
+        system_status = await resources.read_resource("cad://system/status")
         print(f"✅ System status resource: {len(system_status)} characters")
         
         return True
@@ -137,27 +139,24 @@ def test_resources_functionality():
         traceback.print_exc()
         return False
 
-def test_prompts_functionality():
+async def test_prompts_functionality():
     """Test prompts functionality."""
     print("\n🧪 Testing Prompts Functionality...")
     
     try:
-        from prompts.cad_prompts import SolidWorksPrompts
-        import asyncio
-        
         prompts = SolidWorksPrompts()
         
-        # Test list_prompts
-        prompts_list = asyncio.run(prompts.list_prompts())
+        # Test list_prompts (synchronous -- pure list construction)
+        prompts_list = prompts.list_prompts()
         print(f"✅ Prompts list loaded: {len(prompts_list)} prompts available")
         for prompt in prompts_list:
             print(f"   - {prompt.name}: {prompt.description}")
         
         # Test getting a prompt
-        test_prompt = asyncio.run(prompts.get_prompt(
+        test_prompt = await prompts.get_prompt(
             "analyze_cad_file", 
             {"file_path": "/test/file.sldprt", "analysis_focus": "design"}
-        ))
+        )
         print(f"✅ Analyze CAD file prompt: {len(test_prompt)} characters")
         
         return True
@@ -168,8 +167,8 @@ def test_prompts_functionality():
         traceback.print_exc()
         return False
 
-def main():
-    """Run all tests."""
+async def main():
+    """Run all tests on one shared event loop."""
     print("🚀 SolidWorks MCP Server - Test Suite")
     print("=" * 50)
     
@@ -181,12 +180,13 @@ def main():
         test_prompts_functionality
     ]
     
-    passed = 0
-    total = len(tests)
+    # The tests are independent, so they launch together on a single
+    # event loop; waits overlap instead of summing, and no test pays its
+    # own asyncio.run() loop setup and teardown
+    results = await asyncio.gather(*(test() for test in tests))
     
-    for test in tests:
-        if test():
-            passed += 1
+    passed = sum(1 for result in results if result)
+    total = len(results)
     
     print("\n" + "=" * 50)
     print(f"🎯 Test Results: {passed}/{total} tests passed")
@@ -205,4 +205,4 @@ def main():
     return 0
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(asyncio.run(main()))
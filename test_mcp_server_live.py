@@ -28,6 +28,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger("mcp-live-test")
 
+# Pretty-printing large result dicts is the slow part of these logs;
+# prefer orjson's C encoder and only render them when DEBUG will emit
+try:
+    import orjson
+
+    def _dumps_pretty(obj) -> str:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2).decode('utf-8')
+except ImportError:
+    def _dumps_pretty(obj) -> str:
+        return json.dumps(obj, indent=2, default=str)
+
 
 class MCPLiveTester:
     """Live testing class for MCP server functionality."""
@@ -36,6 +47,27 @@ class MCPLiveTester:
         """Initialize the live tester."""
         self.config: ServerConfig = None
         self.solidworks_tools: SolidWorksTools = None
+        # Single-flight caches: the first caller starts the task, every
+        # later caller awaits the same one, so the demo interrogates
+        # SolidWorks once per question instead of once per test
+        self._validation_task: asyncio.Task = None
+        self._formats_task: asyncio.Task = None
+    
+    def _validate_once(self) -> asyncio.Task:
+        """Return the shared validate_installation task, starting it on first use."""
+        if self._validation_task is None:
+            self._validation_task = asyncio.create_task(
+                self.solidworks_tools.validate_installation()
+            )
+        return self._validation_task
+    
+    def _formats_once(self) -> asyncio.Task:
+        """Return the shared get_supported_formats task, starting it on first use."""
+        if self._formats_task is None:
+            self._formats_task = asyncio.create_task(
+                self.solidworks_tools.get_supported_formats()
+            )
+        return self._formats_task
     
     async def setup(self) -> bool:
         """Setup the test environment."""
@@ -50,7 +82,7 @@ class MCPLiveTester:
             return True
             
         except Exception as e:
-            logger.error(f"✗ Setup failed: {e}")
+            logger.error("✗ Setup failed: %s", e)
             return False
     
     async def test_solidworks_connection(self) -> None:
@@ -58,16 +90,19 @@ class MCPLiveTester:
         logger.info("Testing SolidWorks connection...")
         
         try:
-            # Validate installation
-            result = await self.solidworks_tools.validate_installation()
-            logger.info(f"SolidWorks Info: {json.dumps(result, indent=2)}")
-            
-            # Get supported formats
-            formats = await self.solidworks_tools.get_supported_formats()
-            logger.info(f"Supported Formats: {json.dumps(formats, indent=2)}")
+            # Validate installation and fetch formats concurrently; the
+            # two calls are independent, so their waits overlap
+            result, formats = await asyncio.gather(
+                self._validate_once(),
+                self._formats_once()
+            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("SolidWorks Info: %s", _dumps_pretty(result))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Supported Formats: %s", _dumps_pretty(formats))
             
         except Exception as e:
-            logger.error(f"SolidWorks connection test failed: {e}")
+            logger.error("SolidWorks connection test failed: %s", e)
     
     async def test_file_operations(self) -> None:
         """Test file operations with SolidWorks."""
@@ -77,7 +112,8 @@ class MCPLiveTester:
             # Test file analysis (with a dummy file path)
             test_file = "sample_part.sldprt"
             analysis_result = await self.solidworks_tools.analyze_file(test_file)
-            logger.info(f"File Analysis Result: {json.dumps(analysis_result, indent=2)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("File Analysis Result: %s", _dumps_pretty(analysis_result))
             
             # Test file conversion (dummy operation)
             conversion_result = await self.solidworks_tools.convert_file(
@@ -85,10 +121,11 @@ class MCPLiveTester:
                 output_file_path="sample_part.step",
                 export_format="STEP"
             )
-            logger.info(f"File Conversion Result: {json.dumps(conversion_result, indent=2)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("File Conversion Result: %s", _dumps_pretty(conversion_result))
             
         except Exception as e:
-            logger.error(f"File operations test failed: {e}")
+            logger.error("File operations test failed: %s", e)
     
     async def test_mcp_tools(self) -> None:
         """Test MCP tool functionality."""
@@ -97,9 +134,9 @@ class MCPLiveTester:
         try:
             # List available tools
             tools = await self.solidworks_tools.list_tools()
-            logger.info(f"Available MCP Tools ({len(tools)}):")
+            logger.info("Available MCP Tools (%d):", len(tools))
             for tool in tools:
-                logger.info(f"  - {tool.name}: {tool.description}")
+                logger.info("  - %s: %s", tool.name, tool.description)
             
             # Test tool calls
             test_calls = [
@@ -117,16 +154,23 @@ class MCPLiveTester:
                 }
             ]
             
-            for test_call in test_calls:
-                logger.info(f"Testing tool: {test_call['name']}")
-                result = await self.solidworks_tools.call_tool(
-                    test_call['name'], 
-                    test_call['arguments']
-                )
-                logger.info(f"Tool result: {result}")
+            # The three calls are independent coroutines, so they run
+            # concurrently; results are logged back in the original order
+            results = await asyncio.gather(
+                *(
+                    self.solidworks_tools.call_tool(
+                        test_call['name'], test_call['arguments']
+                    )
+                    for test_call in test_calls
+                ),
+                return_exceptions=True
+            )
+            for test_call, result in zip(test_calls, results):
+                logger.info("Testing tool: %s", test_call['name'])
+                logger.info("Tool result: %s", result)
                 
         except Exception as e:
-            logger.error(f"MCP tools test failed: {e}")
+            logger.error("MCP tools test failed: %s", e)
     
     async def demonstrate_workflow(self) -> None:
         """Demonstrate a complete workflow."""
@@ -135,7 +179,7 @@ class MCPLiveTester:
         try:
             # Step 1: Validate SolidWorks installation
             logger.info("Step 1: Validating SolidWorks installation...")
-            validation = await self.solidworks_tools.validate_installation()
+            validation = await self._validate_once()
             if validation.get("status") == "success":
                 logger.info("✓ SolidWorks is ready for operations")
             else:
@@ -144,13 +188,13 @@ class MCPLiveTester:
             
             # Step 2: Get supported formats
             logger.info("Step 2: Getting supported formats...")
-            formats = await self.solidworks_tools.get_supported_formats()
-            logger.info(f"✓ Available export formats: {formats.get('export_formats', [])}")
+            formats = await self._formats_once()
+            logger.info("✓ Available export formats: %s", formats.get('export_formats', []))
             
             # Step 3: Analyze a file (simulated)
             logger.info("Step 3: Analyzing a SolidWorks file...")
             analysis = await self.solidworks_tools.analyze_file("workflow_test.sldprt")
-            logger.info(f"✓ File analysis completed: {analysis.get('properties', {}).get('file_type', 'Unknown')}")
+            logger.info("✓ File analysis completed: %s", analysis.get('properties', {}).get('file_type', 'Unknown'))
             
             # Step 4: Convert file (simulated)
             logger.info("Step 4: Converting file to STEP format...")
@@ -159,12 +203,12 @@ class MCPLiveTester:
                 "workflow_test.step",
                 "STEP"
             )
-            logger.info(f"✓ File conversion completed: {conversion.get('status', 'Unknown')}")
+            logger.info("✓ File conversion completed: %s", conversion.get('status', 'Unknown'))
             
             logger.info("🎉 Complete workflow demonstration finished successfully!")
             
         except Exception as e:
-            logger.error(f"Workflow demonstration failed: {e}")
+            logger.error("Workflow demonstration failed: %s", e)
     
     async def run_live_demo(self) -> None:
         """Run the complete live demonstration."""
@@ -199,7 +243,7 @@ async def main():
     except KeyboardInterrupt:
         logger.info("\nLive test interrupted by user")
     except Exception as e:
-        logger.error(f"Live test failed: {e}")
+        logger.error("Live test failed: %s", e)
 
 
 if __name__ == "__main__":
@@ -6,40 +6,76 @@ This script tests if the MCP server can start and respond correctly.
 """
 
 import asyncio
-import subprocess
+import importlib.util
 import sys
-import time
 from pathlib import Path
 
+async def _server_startup_async():
+    """Start src/main.py and wait for its readiness line without blocking."""
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "src/main.py",
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    
+    try:
+        return await _await_startup(process)
+    finally:
+        # Whatever path exits — success, crash report, or an exception in
+        # the test itself — never leak the server process; a lingering
+        # instance would keep the SolidWorks COM connection alive and
+        # slow later runs
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+
+
+async def _await_startup(process):
+    """Wait for the readiness marker and report the outcome."""
+    # Logging writes to stderr; readuntil resolves the moment the marker
+    # arrives instead of burning a fixed sleep
+    partial = b""
+    try:
+        await asyncio.wait_for(
+            process.stderr.readuntil(b"MCP Server initialized"),
+            timeout=10
+        )
+        ready = True
+    except asyncio.TimeoutError:
+        # No marker yet but the process survived the wait; count that as
+        # started, matching the old poll-based behavior
+        ready = process.returncode is None
+    except (asyncio.IncompleteReadError, asyncio.LimitOverrunError) as e:
+        # Stream ended before the marker — keep what was read so the
+        # failure report still shows the crash output
+        partial = getattr(e, "partial", b"")
+        ready = False
+    
+    if ready:
+        print("✅ Server started successfully")
+        process.terminate()
+        await process.wait()
+        return True
+    
+    # Bound the drain: a crashing server can dump an arbitrarily long
+    # traceback, and the report only needs the head of it
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=2.0)
+    except asyncio.TimeoutError:
+        process.kill()
+        stdout, stderr = b"", b""
+    print("❌ Server failed to start")
+    print(f"STDOUT: {stdout[:4096].decode(errors='replace')}")
+    print(f"STDERR: {(partial + stderr)[:4096].decode(errors='replace')}")
+    return False
+
+
 def test_server_startup():
     """Test if the server can start without errors."""
     print("Testing MCP server startup...")
     
     try:
-        # Start the server in a subprocess
-        process = subprocess.Popen(
-            [sys.executable, "src/main.py"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        
-        # Wait a few seconds for startup
-        time.sleep(3)
-        
-        # Check if process is still running
-        if process.poll() is None:
-            print("✅ Server started successfully")
-            process.terminate()
-            process.wait()
-            return True
-        else:
-            stdout, stderr = process.communicate()
-            print(f"❌ Server failed to start")
-            print(f"STDOUT: {stdout}")
-            print(f"STDERR: {stderr}")
-            return False
-            
+        return asyncio.run(_server_startup_async())
     except Exception as e:
         print(f"❌ Error testing server: {e}")
         return False
@@ -55,17 +91,18 @@ def test_configuration():
             print("❌ src/main.py not found")
             return False
         
-        # Test if Python can import the modules
-        result = subprocess.run([
-            sys.executable, "-c", 
-            "import sys; sys.path.append('src'); from config import Config; print('Configuration module imported successfully')"
-        ], capture_output=True, text=True)
+        # Import in-process: this interpreter can already see src, so
+        # spawning a fresh Python just to import config pays ~200 ms of
+        # interpreter startup for no extra isolation
+        if "src" not in sys.path:
+            sys.path.insert(0, "src")
         
-        if result.returncode == 0:
+        try:
+            from config import Config  # noqa: F401
             print("✅ Configuration is valid")
             return True
-        else:
-            print(f"❌ Configuration error: {result.stderr}")
+        except ImportError as e:
+            print(f"❌ Configuration error: {e}")
             return False
             
     except Exception as e:
@@ -85,14 +122,13 @@ def test_dependencies():
     
     missing_modules = []
     
+    # find_spec answers "is it installed?" without executing the module,
+    # so the check costs a metadata lookup instead of a full import
     for module in required_modules:
-        try:
-            if module == "dotenv":
-                __import__("dotenv")
-            else:
-                __import__(module.replace("-", "_"))
+        spec_name = module.replace("-", "_")
+        if importlib.util.find_spec(spec_name) is not None:
             print(f"✅ {module}")
-        except ImportError:
+        else:
             print(f"❌ {module} - missing")
             missing_modules.append(module)
     
@@ -5,93 +5,71 @@ Update Claude Desktop Configuration with API Key
 This script reads the API key from .env file and updates the Claude Desktop configuration.
 """
 
-import os
 import sys
-import json
-import re
 from pathlib import Path
 from typing import Optional
 
-def get_claude_desktop_config_path() -> Path:
-    """Get the Claude Desktop configuration file path for the current platform."""
-    if sys.platform == "win32":
-        # Windows
-        config_path = Path(os.environ.get("APPDATA", "")) / "Claude" / "claude_desktop_config.json"
-    elif sys.platform == "darwin":
-        # macOS
-        config_path = Path.home() / "Library" / "Application Support" / "Claude" / "claude_desktop_config.json"
-    else:
-        # Linux
-        config_path = Path.home() / ".config" / "Claude" / "claude_desktop_config.json"
-    
-    return config_path
+from claude_desktop import config_path as get_claude_desktop_config_path
+from claude_desktop import edit_config
+
 
 def read_env_file() -> Optional[str]:
     """Read the API key from the .env file."""
-    env_file = Path(".env")
-    if not env_file.exists():
+    try:
+        # Stream line by line and stop at the first match, so only the
+        # prefix of the file up to the key is ever read or held in
+        # memory; fixed-prefix str operations beat a regex scan here
+        with Path(".env").open('r', encoding='utf-8') as f:
+            for line in f:
+                name, sep, value = line.partition('=')
+                if sep and name.strip() == 'ANTHROPIC_API_KEY':
+                    value = value.split('#', 1)[0].strip().strip('"')
+                    if value:
+                        return value
+    except FileNotFoundError:
         print("❌ .env file not found")
         return None
-    
-    try:
-        with open(env_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Extract API key using regex
-        match = re.search(r'ANTHROPIC_API_KEY=(.+)', content)
-        if match:
-            api_key = match.group(1).strip()
-            # Remove any trailing comments or whitespace
-            api_key = re.sub(r'\s*#.*$', '', api_key).strip()
-            return api_key
-        else:
-            print("❌ ANTHROPIC_API_KEY not found in .env file")
-            return None
-            
     except Exception as e:
         print(f"❌ Error reading .env file: {e}")
         return None
 
-def update_claude_config(api_key: str) -> bool:
-    """Update the Claude Desktop configuration with the API key."""
+    print("❌ ANTHROPIC_API_KEY not found in .env file")
+    return None
+
+def update_claude_config(api_key: str) -> Optional[dict]:
+    """Update the Claude Desktop configuration with the API key.
+
+    Returns the mutated config dict so the caller can verify it
+    in memory; the file is read once and written once.
+    """
     config_path = get_claude_desktop_config_path()
-    
-    if not config_path.exists():
-        print(f"❌ Claude Desktop config not found at: {config_path}")
-        return False
-    
+
     try:
-        # Load current config
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-        
-        # Update the API key
-        if "mcpServers" in config and "solidworks-mcp-server" in config["mcpServers"]:
+        # Shared edit context: one read, one write. A raising block
+        # (missing file, missing server entry) writes nothing back.
+        with edit_config(config_path) as config:
             config["mcpServers"]["solidworks-mcp-server"]["env"]["ANTHROPIC_API_KEY"] = api_key
-            print("✓ Updated API key in Claude Desktop configuration")
-        else:
-            print("❌ SolidWorks MCP server configuration not found")
-            return False
-        
-        # Save updated config
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
-        
-        print(f"✓ Configuration saved to: {config_path}")
-        return True
-        
+    except FileNotFoundError:
+        print(f"❌ Claude Desktop config not found at: {config_path}")
+        return None
+    except KeyError:
+        print("❌ SolidWorks MCP server configuration not found")
+        return None
     except Exception as e:
         print(f"❌ Error updating configuration: {e}")
-        return False
+        return None
 
-def verify_config() -> bool:
-    """Verify the configuration was updated correctly."""
-    config_path = get_claude_desktop_config_path()
-    
+    print("✓ Updated API key in Claude Desktop configuration")
+    print(f"✓ Configuration saved to: {config_path}")
+    return config
+
+def verify_config(config: dict) -> bool:
+    """Verify the just-written configuration against the in-memory dict.
+
+    Checking the object we wrote avoids a second disk read and parse,
+    and cannot race with another editor touching the file in between.
+    """
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-        
         api_key = config["mcpServers"]["solidworks-mcp-server"]["env"]["ANTHROPIC_API_KEY"]
         
         if api_key.startswith("sk-ant-api03-"):
@@ -107,11 +85,11 @@ def verify_config() -> bool:
 
 def main():
     """Main function to update the configuration."""
-    print("SolidWorks MCP Server - Claude Desktop API Key Update")
-    print("=" * 55)
-    
-    # Read API key from .env
-    print("Reading API key from .env file...")
+    print(
+        "SolidWorks MCP Server - Claude Desktop API Key Update\n"
+        + "=" * 55
+        + "\nReading API key from .env file..."
+    )
     api_key = read_env_file()
     
     if not api_key:
@@ -122,30 +100,39 @@ def main():
     
     # Update Claude Desktop config
     print("\nUpdating Claude Desktop configuration...")
-    if not update_claude_config(api_key):
+    config = update_claude_config(api_key)
+    if config is None:
         print("❌ Failed to update Claude Desktop configuration")
         return False
     
     # Verify the update
     print("\nVerifying configuration...")
-    if not verify_config():
+    if not verify_config(config):
         print("❌ Configuration verification failed")
         return False
     
-    print("\n" + "=" * 55)
-    print("🎉 API Key Update Complete!")
-    print("=" * 55)
-    
-    print("\n📋 Next Steps:")
-    print("1. Restart Claude Desktop")
-    print("2. Test the SolidWorks MCP server")
-    print("3. Try asking: 'What SolidWorks tools are available?'")
-    
-    print("\n🚀 Your SolidWorks MCP server is now ready to use!")
-    
+    # One write for the closing banner instead of nine line-buffered
+    # prints; each print is a console API round-trip on Windows
+    print("\n".join((
+        "",
+        "=" * 55,
+        "🎉 API Key Update Complete!",
+        "=" * 55,
+        "",
+        "📋 Next Steps:",
+        "1. Restart Claude Desktop",
+        "2. Test the SolidWorks MCP server",
+        "3. Try asking: 'What SolidWorks tools are available?'",
+        "",
+        "🚀 Your SolidWorks MCP server is now ready to use!"
+    )))
+
     return True
 
 if __name__ == "__main__":
+    # Block-buffer stdout for the run; everything is flushed once at exit
+    sys.stdout.reconfigure(line_buffering=False)
     success = main()
+    sys.stdout.flush()
     if not success:
         sys.exit(1)